@@ -2,15 +2,13 @@
 Automatic generation of color configuration files for integrated applications
 based on Kuntatinte color schemes.
 """
-import configparser
 import json
 import logging
 import re
-import subprocess
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from integrations.kuntatinte_colors import generate_and_save_kuntatinte_schemes, parse_scheme_file, get_scheme_file_path
+from integrations.kuntatinte_colors import generate_and_save_kuntatinte_schemes, parse_scheme_file, get_scheme_file_path, read_scheme_file, get_current_scheme_name
 from core.config_manager import config
 
 logger = logging.getLogger(__name__)
@@ -28,11 +26,9 @@ def _extract_color_from_scheme(scheme_path: Path, section: str, key: str) -> tup
         Tuple of (hex color string, opacity 0.0-1.0) or (None, 1.0) if not found
     """
     try:
-        config = configparser.ConfigParser()
-        config.read(scheme_path, encoding='utf-8')
-        
-        if config.has_section(section) and config.has_option(section, key):
-            value = config.get(section, key)
+        # Rules read many keys from the same file; parsed once per change
+        value = read_scheme_file(scheme_path).get(section, {}).get(key)
+        if value is not None:
             logger.info(f"Read from {scheme_path} [{section}] {key} = {value}")
             # Parse RGB/RGBA values like "191,173,160" or "191,173,160,255"
 
@@ -68,19 +64,8 @@ def _extract_color_from_scheme(scheme_path: Path, section: str, key: str) -> tup
     return None, 1.0
 
 def get_active_color_scheme():
-    try:
-        result = subprocess.run(
-            ["kreadconfig6", "--file", "kdeglobals", "--group", "General", "--key", "ColorScheme"],
-            capture_output=True, text=True, check=True
-        )
-        return result.stdout.strip() or None
-    except (FileNotFoundError, subprocess.CalledProcessError):
-        kdeglobals = Path("~/.config/kdeglobals").expanduser()
-        if kdeglobals.exists():
-            config = configparser.ConfigParser()
-            config.read(kdeglobals)
-            return config.get("General", "ColorScheme", fallback=None)
-    return None
+    scheme_name = get_current_scheme_name()
+    return None if scheme_name == "Unknown" else scheme_name
 
 def _load_rules_from_templates(mode: str) -> Dict[str, Any]:
     """Load autogen rules JSON from user templates directory.
@@ -7,6 +7,7 @@ extraction and application theming.
 
 import json
 import logging
+import os
 import subprocess
 import threading
 from collections import Counter
@@ -237,9 +238,12 @@ class PaletteBackend(QObject):
         self._image_list = []
         
         if self._current_folder.exists() and self._current_folder.is_dir():
-            for p in sorted(self._current_folder.iterdir()):
-                if p.suffix.lower() in IMAGE_EXTENSIONS and p.is_file():
-                    self._image_list.append(str(p))
+            # DirEntry carries the name and file type; no Path or stat per entry
+            with os.scandir(self._current_folder) as entries:
+                self._image_list = sorted(
+                    e.path for e in entries
+                    if os.path.splitext(e.name)[1].lower() in IMAGE_EXTENSIONS and e.is_file()
+                )
             
             # Save folder to config for next session
             config.set("paths", "wallpapers_folder", folder_path)
@@ -1314,22 +1318,13 @@ class PaletteBackend(QObject):
         Get complete scheme data for editing.
         Returns dict of {section: {key: {color: "#hex", opacity: 0.0-1.0} or str}}
         """
-        from integrations.kuntatinte_colors import get_scheme_file_path, parse_kde_color
-        import configparser
-        
-        scheme_path = get_scheme_file_path(scheme_name)
-        if not scheme_path:
-            return {}
+        from integrations.kuntatinte_colors import read_scheme_values, parse_kde_color
 
         result = {}
         try:
-            config = configparser.ConfigParser()
-            config.optionxform = lambda optionstr: optionstr
-            config.read(scheme_path)
-
-            for section in config.sections():
+            for section, keys in read_scheme_values(scheme_name).items():
                 result[section] = {}
-                for key, value in config.items(section):
+                for key, value in keys.items():
                     # Try to parse as color
                     hex_color, opacity = parse_kde_color(value)
                     if hex_color != "#000000" or value.strip() in ["0,0,0", "0,0,0,255"]:
@@ -1433,8 +1428,15 @@ class PaletteBackend(QObject):
         # If accent_override provided and index is -1, use it
         if primary_index == -1 and accent_override:
             modified_palette = [accent_override] + list(palette)
-            return get_preview_data(modified_palette, 0, scheme_variant)
-        return get_preview_data(palette, primary_index, scheme_variant)
+            data = get_preview_data(modified_palette, 0, scheme_variant)
+        else:
+            data = get_preview_data(palette, primary_index, scheme_variant)
+        # The generator's cached mappings are read-only; QML needs plain dicts
+        return {
+            'light': dict(data['light']),
+            'dark': dict(data['dark']),
+            'palettes': {name: dict(tones) for name, tones in data['palettes'].items()},
+        }
 
     @pyqtSlot('QVariantList', int, int, 'QString', int, result='QString')
     def generateAndApplyKuntatinte(self, palette: list, primary_index: int, toolbar_opacity: int, accent_override: str = "", scheme_variant: int = 5) -> str:
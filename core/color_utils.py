@@ -6,7 +6,7 @@ Also includes contrast and luminance calculations.
 """
 
 import re
-from typing import Optional, Tuple, TypedDict, List
+from typing import Iterable, Optional, Tuple, TypedDict, List
 
 
 class RGB(TypedDict):
@@ -28,6 +28,12 @@ _hex_to_rgb_cache: dict[str, Tuple[int, int, int]] = {}
 _hex_to_hsl_cache: dict[str, HSL] = {}
 _CACHE_MAX_SIZE = 500  # Limit cache size to prevent memory issues
 
+# Precomputed two-digit hex strings for every channel value (0-255)
+_HEX2 = tuple(f'{i:02X}' for i in range(256))
+
+# Exactly six hex digits, checked before the single int() parse
+_HEX6_RE = re.compile(r'[0-9a-fA-F]{6}')
+
 
 # =============================================================================
 # Basic Conversions
@@ -63,14 +69,13 @@ def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
         # Note: This is a simple implementation. A proper LRU cache would be better
     
     s = normalized.lstrip('#')
-    if len(s) != 6:
+    # int(s, 16) alone would also accept '0x' prefixes, signs, spaces and
+    # underscores, so only plain hex digits get through
+    if not _HEX6_RE.fullmatch(s):
         raise ValueError(f"Invalid hex color: {hex_color}")
     
-    rgb = (
-        int(s[0:2], 16),
-        int(s[2:4], 16),
-        int(s[4:6], 16)
-    )
+    v = int(s, 16)
+    rgb = ((v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF)
     
     _hex_to_rgb_cache[normalized] = rgb
     return rgb
@@ -201,6 +206,17 @@ def hex_to_hsl(hex_color: str) -> HSL:
 
 
 
+# Index into (chroma, x, 0) for the r, g, b components of each 60° hue sector
+_HUE_SECTOR_COMPONENTS = (
+    (0, 1, 2),  # 0-60: c, x, 0
+    (1, 0, 2),  # 60-120: x, c, 0
+    (2, 0, 1),  # 120-180: 0, c, x
+    (2, 1, 0),  # 180-240: 0, x, c
+    (1, 2, 0),  # 240-300: x, 0, c
+    (0, 2, 1),  # 300-360: c, 0, x
+)
+
+
 def hsl_to_rgb(h: float, s: float, l: float) -> RGB:
     """Convert HSL values to RGB dictionary.
     
@@ -219,18 +235,11 @@ def hsl_to_rgb(h: float, s: float, l: float) -> RGB:
     x = c * (1 - abs((h / 60.0) % 2 - 1))
     m = l_ - c / 2
     
-    if 0 <= h < 60:
-        r1, g1, b1 = c, x, 0
-    elif 60 <= h < 120:
-        r1, g1, b1 = x, c, 0
-    elif 120 <= h < 180:
-        r1, g1, b1 = 0, c, x
-    elif 180 <= h < 240:
-        r1, g1, b1 = 0, x, c
-    elif 240 <= h < 300:
-        r1, g1, b1 = x, 0, c
-    else:
-        r1, g1, b1 = c, 0, x
+    # Hues outside 0-360 fall into the last sector, like h >= 300
+    sector = int(h // 60) if 0 <= h < 360 else 5
+    components = (c, x, 0)
+    ri, gi, bi = _HUE_SECTOR_COMPONENTS[sector]
+    r1, g1, b1 = components[ri], components[gi], components[bi]
     
     return {
         'r': max(0, min(255, int(round((r1 + m) * 255)))),
@@ -255,7 +264,42 @@ def hsl_to_hex(h: float, s: float, l: float) -> str:
         max(0, min(100, s)),
         max(0, min(100, l))
     )
-    return '#{0:02X}{1:02X}{2:02X}'.format(rgb['r'], rgb['g'], rgb['b'])
+    return '#' + _HEX2[rgb['r']] + _HEX2[rgb['g']] + _HEX2[rgb['b']]
+
+
+def hsl_to_hex_ramp(h: float, s: float, lightnesses: Iterable[float]) -> List[str]:
+    """Convert one hue/saturation at many lightness values to hex colors.
+    
+    Equivalent to [hsl_to_hex(h, s, l) for l in lightnesses], but the hue
+    sector and hue factor are computed once for the whole ramp.
+    
+    Args:
+        h: Hue (0-360, will be wrapped)
+        s: Saturation (0-100, will be clamped)
+        lightnesses: Lightness values (0-100, will be clamped)
+    
+    Returns:
+        List of hex color strings with # prefix, in input order
+    """
+    h = h % 360
+    s_ = max(0, min(100, s)) / 100.0
+    hue_factor = 1 - abs((h / 60.0) % 2 - 1)
+    sector = int(h // 60) if 0 <= h < 360 else 5
+    ri, gi, bi = _HUE_SECTOR_COMPONENTS[sector]
+    
+    result = []
+    for l in lightnesses:
+        l_ = max(0, min(100, l)) / 100.0
+        c = (1 - abs(2 * l_ - 1)) * s_
+        m = l_ - c / 2
+        components = (c, c * hue_factor, 0)
+        result.append(
+            '#'
+            + _HEX2[max(0, min(255, int(round((components[ri] + m) * 255))))]
+            + _HEX2[max(0, min(255, int(round((components[gi] + m) * 255))))]
+            + _HEX2[max(0, min(255, int(round((components[bi] + m) * 255))))]
+        )
+    return result
 
 
 # =============================================================================
@@ -134,6 +134,7 @@ DEFAULTS: dict[str, dict[str, Any]] = {
     },
     "cache": {
         "cache_dir": "kuntatinte",
+        "fastfetch_full_clear": False,  # Wipe all of ~/.cache/fastfetch, not just the logo's entry
     },
     "logging": {
         "enabled": False,
@@ -4,9 +4,17 @@ File Utilities.
 Helper functions for file and directory operations.
 """
 
+import json
 import os
 from pathlib import Path
-from typing import Union
+from typing import Any, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
 
 PathLike = Union[str, Path]
 
@@ -58,3 +66,38 @@ def ensure_directory_exists(path: PathLike) -> None:
     """
     if not os.path.exists(path):
         os.makedirs(path, exist_ok=True)
+
+
+def json_dumps(obj: Any, indent: int = 2) -> str:
+    """Serialize an object to a JSON string.
+    
+    Uses orjson when it is installed and the indentation is 2 spaces
+    (the only width orjson supports), otherwise the standard library.
+    
+    Args:
+        obj: Object to serialize
+        indent: Number of spaces used for indentation
+    
+    Returns:
+        JSON string
+    """
+    if HAS_ORJSON and indent == 2:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=indent)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+    
+    Args:
+        data: JSON document as text or UTF-8 bytes
+    
+    Returns:
+        Parsed object
+    
+    Raises:
+        json.JSONDecodeError: If the document is invalid
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
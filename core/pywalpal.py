@@ -2,9 +2,13 @@
 Pywal palette generation based on Kuntatinte Color Scheme inputs.
 """
 
+import functools
+import hashlib
 import json
 import logging
-from typing import Dict, Any, Optional
+import re
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 import os
 
 try:
@@ -22,27 +26,106 @@ except ImportError:
     from .imagemagick import get_color_hsl
     from .color_utils import hsl_to_hex
 
+from core.file_utils import json_dumps, json_loads
 from integrations.pywal import generate_palette
 
 logger = logging.getLogger(__name__)
 
+# Captures the dark and light JSON blocks of generate_pywal_palettes output
+_PALETTE_BLOCKS_RE = re.compile(r'Dark Palette:\n(\{.*?\})\n\nLight Palette:\n(\{.*\})', re.DOTALL)
+
+# Source palette and tone for color0..color15 of the pywal palettes
+_DARK_PALETTE_SPEC = (
+    ('neutral', 10), ('primary', 70), ('secondary', 70), ('primary', 60),
+    ('primary', 50), ('secondary', 50), ('primary', 40), ('neutral', 80),
+    ('neutral', 20), ('primary', 60), ('secondary', 60), ('primary', 50),
+    ('primary', 40), ('secondary', 40), ('primary', 30), ('neutral', 90),
+)
+
+_LIGHT_PALETTE_SPEC = (
+    ('neutral', 99), ('primary', 40), ('secondary', 40), ('primary', 40),
+    ('primary', 50), ('secondary', 50), ('primary', 60), ('neutral', 20),
+    ('neutral', 80), ('primary', 50), ('secondary', 50), ('primary', 60),
+    ('primary', 70), ('secondary', 70), ('primary', 80), ('neutral', 10),
+)
+
+
+def _normalize_hex(color: Any) -> Any:
+    """Return a hex color in canonical lowercase form; other values unchanged."""
+    if isinstance(color, str) and color.startswith('#'):
+        return color.lower()
+    return color
+
+
+def _build_pywal_palette(scheme: Mapping[str, Mapping[int, str]], spec: tuple, special_colors: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Build a pywal-like palette from a dark or light scheme.
+    
+    Args:
+        scheme: Scheme with 'primary', 'secondary' and 'neutral' tones
+        spec: (source, tone) pairs for color0..color15
+        special_colors: Optional background/foreground overrides
+    
+    Returns:
+        Palette with background, foreground and color0..color15
+    """
+    colors = {f'color{i}': _normalize_hex(scheme[source][tone]) for i, (source, tone) in enumerate(spec)}
+    if special_colors is None:
+        special_colors = {'background': colors['color0'], 'foreground': colors['color15']}
+    return {
+        'background': _normalize_hex(special_colors['background']),
+        'foreground': _normalize_hex(special_colors['foreground']),
+        **colors,
+    }
+
+# Parsed colors.json files by path: ((ino, mtime_ns, size), digest, data)
+_colors_json_cache: Dict[str, Tuple[Tuple[int, int, int], bytes, Dict[str, Any]]] = {}
+
+
+def _read_colors_json(path) -> Tuple[bytes, Dict[str, Any]]:
+    """Read a colors.json file, reusing the last parse while it is unchanged.
+    
+    The file is read in binary mode and handed to the JSON parser as bytes,
+    so it is neither decoded nor reopened while its stat stays the same.
+    Rewrites usually keep the size (fixed-length hex colors), so the inode
+    is part of the stamp to catch files replaced within one mtime tick.
+    
+    Args:
+        path: Path to the colors.json file
+    
+    Returns:
+        Tuple of (content digest, parsed data)
+    """
+    st = os.stat(path)
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _colors_json_cache.get(str(path))
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2]
+    
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    data = json_loads(raw)
+    _colors_json_cache[str(path)] = (stamp, digest, data)
+    return digest, data
+
+
 def load_pywal_colors(cache_dir: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Load colors.json from pywal cache."""
     if cache_dir is None:
         cache_dir = os.path.expanduser("~/.cache/wal")
     
     colors_path = os.path.join(cache_dir, "colors.json")
-    if os.path.exists(colors_path):
-        try:
-            with open(colors_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f"Failed to load pywal colors.json: {e}")
+    try:
+        return _read_colors_json(colors_path)[1]
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to load pywal colors.json: {e}")
     return None
 
 def compare_pywal_palettes(kuntatinte_palette: Dict[str, Any], pywal_palette: Dict[str, Any]) -> str:
     """Compare Kuntatinte palette with pywal palette and return differences."""
-    result = "Comparison between Kuntatinte and pywal palettes:\n\n"
+    parts = ["Comparison between Kuntatinte and pywal palettes:", ""]
     
     # Extract colors from kuntatinte (assuming it's the format from generate_pywal_palettes)
     # kuntatinte_palette should have 'Dark Palette' and 'Light Palette'
@@ -52,24 +135,18 @@ def compare_pywal_palettes(kuntatinte_palette: Dict[str, Any], pywal_palette: Di
     # pywal_palette is typically {'color0': '#...', 'color1': '#...', ...}
     pywal_colors = pywal_palette.get('colors', pywal_palette)  # Handle both formats
     
-    # Compare dark palette (assuming dark is used)
-    result += "Dark Palette Comparison:\n"
-    for i in range(16):
-        color_key = f'color{i}'
-        kuntatinte_color = kuntatinte_dark.get(color_key, 'N/A')
-        pywal_color = pywal_colors.get(color_key, 'N/A')
-        match = "✓" if kuntatinte_color == pywal_color else "✗"
-        result += f"  {color_key}: Kuntatinte={kuntatinte_color} | pywal={pywal_color} {match}\n"
-    
-    result += "\nLight Palette Comparison:\n"
-    for i in range(16):
-        color_key = f'color{i}'
-        kuntatinte_color = kuntatinte_light.get(color_key, 'N/A')
-        pywal_color = pywal_colors.get(color_key, 'N/A')
-        match = "✓" if kuntatinte_color == pywal_color else "✗"
-        result += f"  {color_key}: Kuntatinte={kuntatinte_color} | pywal={pywal_color} {match}\n"
-    
-    return result
+    # Compare dark palette (assuming dark is used), then light palette
+    for title, kuntatinte_colors in (("Dark", kuntatinte_dark), ("Light", kuntatinte_light)):
+        parts.append(f"{title} Palette Comparison:")
+        for i in range(16):
+            color_key = f'color{i}'
+            kuntatinte_color = kuntatinte_colors.get(color_key, 'N/A')
+            pywal_color = pywal_colors.get(color_key, 'N/A')
+            match = "✓" if _normalize_hex(kuntatinte_color) == _normalize_hex(pywal_color) else "✗"
+            parts.append(f"  {color_key}: Kuntatinte={kuntatinte_color} | pywal={pywal_color} {match}")
+        parts.append("")
+    
+    return '\n'.join(parts)
 
 def generate_tones_from_color(base_hex: str, chroma_multiplier: float = 1.0, tone_multiplier: float = 1.0) -> Dict[str, str]:
     """Generate a set of tones from a base color, simulating Material You palettes."""
@@ -97,6 +174,7 @@ def generate_tones_from_color(base_hex: str, chroma_multiplier: float = 1.0, ton
     
     return tones
 
+@functools.lru_cache(maxsize=256)
 def adjust_brightness(hex_color: str, factor: float) -> str:
     """Adjust brightness of a hex color."""
     if MATERIAL_COLOR_UTILITIES_AVAILABLE:
@@ -113,8 +191,14 @@ def adjust_brightness(hex_color: str, factor: float) -> str:
         new_l = min(100, max(0, hsl['l'] * factor))
         return hsl_to_hex(hsl['h'], hsl['s'], new_l)
 
-def get_color_schemes(primary_color: str, scheme_variant: int = 5, chroma_multiplier: float = 1.0, tone_multiplier: float = 1.0) -> Dict[str, Any]:
-    """Generate color schemes for dark and light modes."""
+@functools.lru_cache(maxsize=32)
+def get_color_schemes(primary_color: str, scheme_variant: int = 5, chroma_multiplier: float = 1.0, tone_multiplier: float = 1.0) -> Mapping[str, Any]:
+    """Generate color schemes for dark and light modes.
+    
+    The result depends only on the arguments and is shared between calls
+    (generating, comparing and saving the same palette), so it is returned
+    read-only.
+    """
     if MATERIAL_COLOR_UTILITIES_AVAILABLE:
         # Use material-color-utilities for accurate Material You colors
         primary_argb = argb_from_hex(primary_color)
@@ -156,18 +240,18 @@ def get_color_schemes(primary_color: str, scheme_variant: int = 5, chroma_multip
         light_secondary = {k: adjust_brightness(v, 1.1) for k, v in light_primary.items()}  # Slightly brighter
         light_neutral = {k: v for k, v in tones.items() if k in [10, 20, 80, 90, 95, 99]}
     
-    return {
-        'dark': {
-            'primary': dark_primary,
-            'secondary': dark_secondary,
-            'neutral': dark_neutral
-        },
-        'light': {
-            'primary': light_primary,
-            'secondary': light_secondary,
-            'neutral': light_neutral
-        }
-    }
+    return MappingProxyType({
+        'dark': MappingProxyType({
+            'primary': MappingProxyType(dark_primary),
+            'secondary': MappingProxyType(dark_secondary),
+            'neutral': MappingProxyType(dark_neutral)
+        }),
+        'light': MappingProxyType({
+            'primary': MappingProxyType(light_primary),
+            'secondary': MappingProxyType(light_secondary),
+            'neutral': MappingProxyType(light_neutral)
+        })
+    })
 
 def generate_pywal_palettes(primary_color: str, accent_color: str = "", scheme_variant: int = 5, chroma_multiplier: float = 1.0, tone_multiplier: float = 1.0, wallpaper_path: Optional[str] = None) -> str:
     """Generate pywal palettes for light and dark modes."""
@@ -202,60 +286,13 @@ def generate_pywal_palettes(primary_color: str, accent_color: str = "", scheme_v
             "wallpaper_path": wallpaper_path
         }
         
-        result = f"Input Parameters:\n{json.dumps(params, indent=2)}\n\n"
+        result = f"Input Parameters:\n{json_dumps(params)}\n\n"
         
         # Build pywal-like palettes (simplified)
-        dark_primary = schemes['dark']['primary']
-        dark_secondary = schemes['dark']['secondary']
-        dark_neutral = schemes['dark']['neutral']
-        
-        dark_palette = {
-            'background': wallpaper_special_colors['background'] if wallpaper_special_colors else dark_neutral[10],
-            'foreground': wallpaper_special_colors['foreground'] if wallpaper_special_colors else dark_neutral[90],
-            'color0': dark_neutral[10],
-            'color1': dark_primary[70],
-            'color2': dark_secondary[70],
-            'color3': dark_primary[60],
-            'color4': dark_primary[50],
-            'color5': dark_secondary[50],
-            'color6': dark_primary[40],
-            'color7': dark_neutral[80],
-            'color8': dark_neutral[20],
-            'color9': dark_primary[60],
-            'color10': dark_secondary[60],
-            'color11': dark_primary[50],
-            'color12': dark_primary[40],
-            'color13': dark_secondary[40],
-            'color14': dark_primary[30],
-            'color15': dark_neutral[90],
-        }
+        dark_palette = _build_pywal_palette(schemes['dark'], _DARK_PALETTE_SPEC, wallpaper_special_colors)
+        light_palette = _build_pywal_palette(schemes['light'], _LIGHT_PALETTE_SPEC, wallpaper_special_colors)
         
-        light_primary = schemes['light']['primary']
-        light_secondary = schemes['light']['secondary']
-        light_neutral = schemes['light']['neutral']
-        
-        light_palette = {
-            'background': wallpaper_special_colors['background'] if wallpaper_special_colors else light_neutral[99],
-            'foreground': wallpaper_special_colors['foreground'] if wallpaper_special_colors else light_neutral[10],
-            'color0': light_neutral[99],
-            'color1': light_primary[40],
-            'color2': light_secondary[40],
-            'color3': light_primary[40],
-            'color4': light_primary[50],
-            'color5': light_secondary[50],
-            'color6': light_primary[60],
-            'color7': light_neutral[20],
-            'color8': light_neutral[80],
-            'color9': light_primary[50],
-            'color10': light_secondary[50],
-            'color11': light_primary[60],
-            'color12': light_primary[70],
-            'color13': light_secondary[70],
-            'color14': light_primary[80],
-            'color15': light_neutral[10],
-        }
-        
-        result += f"Dark Palette:\n{json.dumps(dark_palette, indent=2)}\n\nLight Palette:\n{json.dumps(light_palette, indent=2)}"
+        result += f"Dark Palette:\n{json_dumps(dark_palette)}\n\nLight Palette:\n{json_dumps(light_palette)}"
         logger.info("Generated pywal palettes")
         return result
     except Exception as e:
@@ -275,23 +312,11 @@ def generate_and_compare_pywal_palettes(primary_color: str, accent_color: str =
     # Parse kuntatinte output to get palettes
     try:
         # The output has "Dark Palette:\n{json}\n\nLight Palette:\n{json}"
-        lines = kuntatinte_output.split('\n')
-        dark_start = None
-        light_start = None
-        for i, line in enumerate(lines):
-            if line.startswith('Dark Palette:'):
-                dark_start = i + 1
-            elif line.startswith('Light Palette:'):
-                light_start = i + 1
-        
-        if dark_start and light_start:
-            dark_json = '\n'.join(lines[dark_start:light_start-2])  # -2 to skip empty line
-            light_json = '\n'.join(lines[light_start:])
-            kuntatinte_dark = json.loads(dark_json)
-            kuntatinte_light = json.loads(light_json)
+        match = _PALETTE_BLOCKS_RE.search(kuntatinte_output)
+        if match:
             kuntatinte_palettes = {
-                'Dark Palette': kuntatinte_dark,
-                'Light Palette': kuntatinte_light
+                'Dark Palette': json_loads(match.group(1)),
+                'Light Palette': json_loads(match.group(2))
             }
         else:
             return kuntatinte_output + "\n\nFailed to parse Kuntatinte palettes for comparison."
@@ -305,7 +330,6 @@ def generate_and_compare_pywal_palettes(primary_color: str, accent_color: str =
 
 def save_kuntatinte_colors_json(primary_color: str, accent_color: str = "", scheme_variant: int = 5, chroma_multiplier: float = 1.0, tone_multiplier: float = 1.0, wallpaper_path: Optional[str] = None, config_dir: str = "") -> None:
     """Generate and save Kuntatinte colors as pywal-style colors.json."""
-    import json
     from pathlib import Path
     
     if not config_dir:
@@ -331,30 +355,7 @@ def save_kuntatinte_colors_json(primary_color: str, accent_color: str = "", sche
             logger.warning(f"Failed to extract colors from wallpaper: {e}")
     
     # Use dark palette for pywal format
-    dark_primary = schemes['dark']['primary']
-    dark_secondary = schemes['dark']['secondary']
-    dark_neutral = schemes['dark']['neutral']
-    
-    dark_palette = {
-        'background': wallpaper_special_colors['background'] if wallpaper_special_colors else dark_neutral[10],
-        'foreground': wallpaper_special_colors['foreground'] if wallpaper_special_colors else dark_neutral[90],
-        'color0': dark_neutral[10],
-        'color1': dark_primary[70],
-        'color2': dark_secondary[70],
-        'color3': dark_primary[60],
-        'color4': dark_primary[50],
-        'color5': dark_secondary[50],
-        'color6': dark_primary[40],
-        'color7': dark_neutral[80],
-        'color8': dark_neutral[20],
-        'color9': dark_primary[60],
-        'color10': dark_secondary[60],
-        'color11': dark_primary[50],
-        'color12': dark_primary[40],
-        'color13': dark_secondary[40],
-        'color14': dark_primary[30],
-        'color15': dark_neutral[90],
-    }
+    dark_palette = _build_pywal_palette(schemes['dark'], _DARK_PALETTE_SPEC, wallpaper_special_colors)
     
     # Convert to pywal format
     pywal_json = {
@@ -368,8 +369,11 @@ def save_kuntatinte_colors_json(primary_color: str, accent_color: str = "", sche
         "colors": {k: v for k, v in dark_palette.items() if k.startswith('color')}
     }
     
+    # Encode in memory and write once; json.dump writes chunk by chunk
+    data = json.dumps(pywal_json, indent=4, ensure_ascii=False)
     with open(colors_path, 'w', encoding='utf-8') as f:
-        json.dump(pywal_json, f, indent=4, ensure_ascii=False)
+        f.write(data)
+    _colors_json_cache.pop(str(colors_path), None)
     
     logger.info(f"Saved Kuntatinte colors.json to {colors_path}")
 
@@ -379,7 +383,6 @@ def compare_colors_json(kuntatinte_config_dir: str = "", pywal_cache_dir: str =
     Returns:
         True if palettes match, False otherwise.
     """
-    import json
     import os
     from pathlib import Path
     
@@ -400,11 +403,13 @@ def compare_colors_json(kuntatinte_config_dir: str = "", pywal_cache_dir: str =
         logger.warning("pywal colors.json not found")
         return False
     
-    with open(kuntatinte_path, 'r') as f:
-        kuntatinte_data = json.load(f)
+    kuntatinte_digest, kuntatinte_data = _read_colors_json(kuntatinte_path)
+    pywal_digest, pywal_data = _read_colors_json(pywal_path)
     
-    with open(pywal_path, 'r') as f:
-        pywal_data = json.load(f)
+    # Byte-identical files always match
+    if kuntatinte_digest == pywal_digest:
+        logger.info("Palette comparison result: matches")
+        return True
     
     # Compare colors
     kuntatinte_colors = kuntatinte_data.get('colors', {})
@@ -418,7 +423,7 @@ def compare_colors_json(kuntatinte_config_dir: str = "", pywal_cache_dir: str =
         color_key = f'color{i}'
         k_color = kuntatinte_colors.get(color_key)
         p_color = pywal_colors.get(color_key)
-        if k_color != p_color:
+        if _normalize_hex(k_color) != _normalize_hex(p_color):
             logger.info(f"Color mismatch {color_key}: Kuntatinte={k_color}, pywal={p_color}")
             matches = False
     
@@ -426,7 +431,7 @@ def compare_colors_json(kuntatinte_config_dir: str = "", pywal_cache_dir: str =
     for key in ['background', 'foreground']:
         k_special = kuntatinte_special.get(key)
         p_special = pywal_special.get(key)
-        if k_special != p_special:
+        if _normalize_hex(k_special) != _normalize_hex(p_special):
             logger.info(f"Special color mismatch {key}: Kuntatinte={k_special}, pywal={p_special}")
             matches = False
     
@@ -10,18 +10,33 @@ Workflow:
 4. Clear fastfetch cache
 """
 
+import functools
+import hashlib
+import itertools
 import json
 import logging
+import os
 import re
 import shutil
 import subprocess
+import threading
 from pathlib import Path
 from typing import Optional, Tuple
 
 
 logger = logging.getLogger(__name__)
 
+from core.color_utils import hex_to_rgb
 from core.config_manager import config as app_config
+from core.file_utils import json_loads
+
+# Try to import PIL for in-process tinting (ImageMagick is used otherwise)
+try:
+    from PIL import Image  # type: ignore[import-not-found]
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+    Image = None  # type: ignore[misc, assignment]
 
 
 # =============================================================================
@@ -58,66 +73,112 @@ def _get_cache_dir() -> Path:
     return Path.home() / '.cache' / 'fastfetch'
 
 
+def _get_preview_cache_dir() -> Path:
+    """Get the per-user directory for tinted previews."""
+    return app_config.cache_dir / 'fastfetch_preview'
+
+
+def _get_gray_cache_dir() -> Path:
+    """Get the per-user directory for grayscale masters."""
+    return app_config.cache_dir / 'fastfetch_gray'
+
+
+def _clear_logo_cache(cache_dir: Path, logo_path: Path) -> None:
+    """Drop fastfetch's cached renders of the logo.
+    
+    fastfetch caches image logos under images/<absolute logo path>/, so only
+    that entry is removed instead of walking the whole cache. The
+    cache.fastfetch_full_clear option restores the old full wipe for cache
+    layouts that differ.
+    """
+    if app_config.get('cache', 'fastfetch_full_clear', False):
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        return
+    
+    logo_path = logo_path.absolute()
+    shutil.rmtree(cache_dir / 'images' / logo_path.relative_to(logo_path.anchor), ignore_errors=True)
+
+
+# Tinted previews, keyed by source image stat and accent color
+_PREVIEW_CACHE_MAX_ENTRIES = 32
+_PREVIEW_TMP_SLOTS = 4
+_PREVIEW_TMP_RING = itertools.cycle(range(_PREVIEW_TMP_SLOTS))
+_PREVIEW_TMP_LOCK = threading.Lock()
+
+# Accent colors accepted by apply/preview, checked before any image work
+_HEX_RE = re.compile(r'#[0-9a-fA-F]{6}')
+
+# Grayscale masters of source images, keyed by source stat
+_GRAY_CACHE_MAX_ENTRIES = 8
+
+
 # =============================================================================
 # Configuration Parsing
 # =============================================================================
 
-def _strip_jsonc_comments(content: str) -> str:
-    """Remove JSONC-style comments from content.
+# Matches, in order of priority: a string literal, a // comment, or a trailing
+# comma (possibly followed by comments) before a closing bracket
+_JSONC_CLEAN_RE = re.compile(r'"(?:\\.|[^"\\])*"|//[^\n]*|,(?:\s|//[^\n]*)*([}\]])')
+
+
+# Fast path for the logo source: "logo": { ... "source": "<path>" ... }
+_LOGO_SOURCE_RE = re.compile(r'"logo"\s*:\s*\{[^{}]*?"source"\s*:\s*"([^"\\\n]*)"')
+
+
+def _clean_jsonc_match(match: re.Match) -> str:
+    """Replacement callback for _JSONC_CLEAN_RE."""
+    text = match.group(0)
+    if text[0] == '"':
+        return text  # String literal, keep as-is
+    return match.group(1) or ''  # Drop comments and trailing commas
+
+
+def _clean_jsonc(content: str) -> str:
+    """Convert JSONC content to plain JSON.
     
-    Handles // comments while preserving strings that contain //.
+    Removes // comments and trailing commas in a single pass while
+    preserving strings that contain // or commas.
     
     Args:
         content: Raw JSONC file content
     
     Returns:
-        Content with comments removed
+        Content with comments and trailing commas removed
     """
-    lines = []
-    for line in content.split('\n'):
-        in_string = False
-        result = []
-        i = 0
-        while i < len(line):
-            if line[i] == '"' and (i == 0 or line[i-1] != '\\'):
-                in_string = not in_string
-                result.append(line[i])
-            elif not in_string and line[i:i+2] == '//':
-                break  # Rest of line is comment
-            else:
-                result.append(line[i])
-            i += 1
-        lines.append(''.join(result))
-    return '\n'.join(lines)
+    return _JSONC_CLEAN_RE.sub(_clean_jsonc_match, content)
 
 
-def get_logo_path_from_config() -> Optional[Path]:
-    """Read the logo source path from fastfetch config.jsonc.
+@functools.lru_cache(maxsize=8)
+def _resolve_logo_path(config_path: Path, mtime_ns: int, size: int) -> Optional[Path]:
+    """Parse the logo source path out of config.jsonc.
     
-    Returns:
-        Full path to the logo image, or None if not found.
+    Cached per config path, mtime and size, so the file is only re-read
+    and re-parsed after it changes.
     """
-    config_path = _get_config_path()
-    if not config_path.exists():
-        return None
-    
     try:
         with open(config_path, 'r') as f:
             content = f.read()
         
-        # Remove JSONC comments
-        content = _strip_jsonc_comments(content)
+        # Take the source straight from the text unless a // comment appears
+        # anywhere from the "logo" line to the matched source value (it may
+        # comment out either of them), in which case the full parse decides
+        match = _LOGO_SOURCE_RE.search(content)
+        if match:
+            line_start = content.rfind('\n', 0, match.start()) + 1
+            if '//' not in content[line_start:match.end()]:
+                logo_source = match.group(1)
+                return Path(os.path.expanduser(logo_source)) if logo_source else None
         
-        # Remove trailing commas (common in JSONC)
-        content = re.sub(r',\s*([}\]])', r'\1', content)
+        # Remove JSONC comments and trailing commas
+        content = _clean_jsonc(content)
         
-        data = json.loads(content)
+        data = json_loads(content)
         
         # Extract logo source path
         logo_source = data.get('logo', {}).get('source', '')
         if logo_source:
-            # Expand ~ to home directory
-            return Path(logo_source.replace('~', str(Path.home())))
+            # Expand ~ and ~user prefixes to home directories
+            return Path(os.path.expanduser(logo_source))
         
         return None
     except (json.JSONDecodeError, Exception) as e:
@@ -125,10 +186,224 @@ def get_logo_path_from_config() -> Optional[Path]:
         return None
 
 
+def get_logo_path_from_config() -> Optional[Path]:
+    """Read the logo source path from fastfetch config.jsonc.
+    
+    Returns:
+        Full path to the logo image, or None if not found.
+    """
+    config_path = _get_config_path()
+    try:
+        st = config_path.stat()
+    except OSError:
+        return None
+    
+    return _resolve_logo_path(config_path, st.st_mtime_ns, st.st_size)
+
+
+# =============================================================================
+# ImageMagick Runner
+# =============================================================================
+
+def _magick_tint(source: Path, output: Path, accent_color: str) -> None:
+    """Convert an image to grayscale and tint it with ImageMagick.
+    
+    Raises:
+        FileNotFoundError: If magick is not installed.
+        subprocess.CalledProcessError: If magick fails.
+    """
+    # Arguments are encoded here once; a bytes argv reaches exec unconverted.
+    # Only stderr is needed, for the error message
+    subprocess.run(
+        [b'magick', os.fsencode(source), b'-colorspace', b'gray',
+         b'-fill', accent_color.encode('ascii'), b'-tint', b'80', os.fsencode(output)],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+
+
+# Tint strength, matching ImageMagick's `-tint 80`
+_TINT_PERCENT = 80
+
+
+def _tint_lut(channel: int, fill_intensity: float) -> list:
+    """Build a 256-entry lookup table for one channel of ImageMagick's tint.
+    
+    TintImage shifts each value by (fill * percent - intensity(fill)),
+    weighted by 1 - 4 * (v - 0.5)^2 so midtones get the most color.
+    """
+    shift = channel * _TINT_PERCENT / 100.0 - fill_intensity
+    lut = []
+    for v in range(256):
+        weight = v / 255.0 - 0.5
+        value = v + shift * (1.0 - 4.0 * weight * weight)
+        lut.append(min(255, max(0, int(value + 0.5))))
+    return lut
+
+
+def _pillow_grayscale(img) -> Tuple[object, object]:
+    """Split a Pillow image into (luma, alpha) channels.
+    
+    Gray images (e.g. cached grayscale masters) are used as-is; anything else
+    is reduced with Rec. 709 luma, as ImageMagick's -colorspace gray.
+    """
+    if img.mode == 'LA':
+        return img.getchannel('L'), img.getchannel('A')
+    if img.mode == 'L':
+        return img, None
+    rgba = img.convert('RGBA')
+    gray = rgba.convert('RGB').convert('L', (0.2126, 0.7152, 0.0722, 0))
+    return gray, rgba.getchannel('A')
+
+
+def _pillow_tint(source: Path, output: Path, accent_color: str) -> bool:
+    """Convert an image to grayscale and tint it in-process with Pillow.
+    
+    Args:
+        source: Source image path
+        output: Output image path (format taken from its extension)
+        accent_color: Hex color string (e.g., '#569cc1')
+    
+    Returns:
+        True if the image was written, False if Pillow cannot handle it.
+    """
+    with Image.open(source) as img:
+        if getattr(img, 'n_frames', 1) > 1:
+            return False  # Let ImageMagick tint every frame
+        gray, alpha = _pillow_grayscale(img)
+    
+    r, g, b = hex_to_rgb(accent_color)
+    fill_intensity = 0.2126 * r + 0.7152 * g + 0.0722 * b
+    channels = [gray.point(_tint_lut(c, fill_intensity)) for c in (r, g, b)]
+    
+    if alpha is None:
+        Image.merge('RGB', channels).save(output)
+        return True
+    
+    tinted = Image.merge('RGBA', channels + [alpha])
+    try:
+        tinted.save(output)
+    except OSError:
+        tinted.convert('RGB').save(output)  # Format without alpha (e.g. JPEG)
+    return True
+
+
+def _write_gray_master(source: Path, master_base: Path) -> Path:
+    """Write the grayscale version of source next to master_base.
+    
+    Pillow writes an 'LA' PNG; images Pillow cannot handle go through
+    ImageMagick into MIFF, which keeps every frame losslessly.
+    
+    Returns:
+        Path of the written master.
+    """
+    if HAS_PIL:
+        try:
+            with Image.open(source) as img:
+                if getattr(img, 'n_frames', 1) == 1:
+                    gray, alpha = _pillow_grayscale(img)
+                    master = master_base.with_suffix('.png')
+                    tmp_master = _get_temp_sibling(master)
+                    try:
+                        if alpha is None:
+                            gray.save(tmp_master)
+                        else:
+                            Image.merge('LA', (gray, alpha)).save(tmp_master)
+                        os.replace(tmp_master, master)
+                    finally:
+                        tmp_master.unlink(missing_ok=True)
+                    return master
+        except Exception as e:
+            logger.debug(f"Pillow grayscale failed, using ImageMagick: {e}")
+    
+    master = master_base.with_suffix('.miff')
+    tmp_master = _get_temp_sibling(master)
+    try:
+        subprocess.run(
+            ['magick', str(source), '-colorspace', 'gray', str(tmp_master)],
+            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+        os.replace(tmp_master, master)
+    finally:
+        tmp_master.unlink(missing_ok=True)
+    return master
+
+
+def _get_gray_master(source: Path) -> Path:
+    """Get the cached grayscale master of a source image.
+    
+    The master is keyed by the source path, mtime and size, so it is built
+    once per source image and accent changes only pay for the tint step.
+    """
+    st = source.stat()
+    key = hashlib.blake2b(
+        f"{source}|{st.st_mtime_ns}|{st.st_size}".encode(),
+        digest_size=16
+    ).hexdigest()
+    cache_dir = _get_gray_cache_dir()
+    master_base = cache_dir / key
+    for suffix in ('.png', '.miff'):
+        master = master_base.with_suffix(suffix)
+        if master.exists():
+            os.utime(master)  # Mark as recently used
+            return master
+    
+    cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    master = _write_gray_master(source, master_base)
+    _evict_cache_dir(cache_dir, _GRAY_CACHE_MAX_ENTRIES)
+    return master
+
+
+def _tint_image(source: Path, output: Path, accent_color: str) -> None:
+    """Convert an image to grayscale and tint it with the accent color.
+    
+    Tints the cached grayscale master of source when it can be built, using
+    Pillow when available and ImageMagick for anything it cannot handle
+    (missing Pillow, unsupported formats, animations).
+    
+    Raises:
+        FileNotFoundError: If ImageMagick is needed but not installed.
+        subprocess.CalledProcessError: If ImageMagick fails.
+    """
+    try:
+        source = _get_gray_master(source)
+    except Exception as e:
+        logger.debug(f"Could not build grayscale master for {source}: {e}")
+    
+    if HAS_PIL:
+        try:
+            if _pillow_tint(source, output, accent_color):
+                return
+        except Exception as e:
+            logger.debug(f"Pillow tint failed, using ImageMagick: {e}")
+    
+    # -colorspace gray is a no-op on an already gray master
+    _magick_tint(source, output, accent_color)
+
+
 # =============================================================================
 # Apply and Restore Functions
 # =============================================================================
 
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hard link src to dst, copying instead when linking is not possible.
+    
+    The copy fallback uses shutil.copyfile, which copies in the kernel
+    (sendfile/copy_file_range) and skips the metadata the logo does not need.
+    Callers must replace linked files with os.replace rather than rewriting
+    them in place, otherwise both names would see the new content.
+    """
+    try:
+        os.link(src, dst)
+    except (OSError, NotImplementedError):
+        shutil.copyfile(src, dst)
+        os.chmod(dst, 0o644)
+
+
+def _get_temp_sibling(path: Path) -> Path:
+    """Get a hidden temporary path next to path, keeping its extension."""
+    return path.with_name(f'.{path.stem}.tmp{path.suffix}')
+
+
 def apply_fastfetch_accent(accent_color: str) -> Tuple[bool, str]:
     """Apply accent color tint to fastfetch logo.
     
@@ -144,6 +419,9 @@ def apply_fastfetch_accent(accent_color: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (success: bool, message: str)
     """
+    if not _HEX_RE.fullmatch(accent_color):
+        return False, f"Invalid accent color: {accent_color}"
+    
     # Get logo path from config
     logo_path = get_logo_path_from_config()
     if not logo_path:
@@ -158,30 +436,23 @@ def apply_fastfetch_accent(accent_color: str) -> Tuple[bool, str]:
     
     # Ensure logo directory exists
     logo_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_logo_path = _get_temp_sibling(logo_path)
     
     try:
         # Step 1: Backup existing logo if it exists and no backup yet
         if logo_path.exists() and not backup_path.exists():
-            shutil.copy2(logo_path, backup_path)
+            _link_or_copy(logo_path, backup_path)
         
-        # Step 2: Convert source to grayscale and save to logo path
-        subprocess.run([
-            'magick', str(source_image),
-            '-colorspace', 'gray',
-            str(logo_path)
-        ], check=True, capture_output=True)
+        # Step 2: Convert source to grayscale and tint it with the accent color.
+        # Written next to the logo and renamed over it, so a hard-linked
+        # backup keeps the original image.
+        _tint_image(source_image, tmp_logo_path, accent_color)
+        os.replace(tmp_logo_path, logo_path)
         
-        # Step 3: Apply tint with accent color
-        subprocess.run([
-            'magick', str(logo_path),
-            '-fill', accent_color,
-            '-tint', '80',
-            str(logo_path)
-        ], check=True, capture_output=True)
-        
-        # Step 4: Clear fastfetch cache
+        # Step 3: Clear fastfetch cache once the new logo is in place, so a
+        # fastfetch run in between cannot re-cache the old one
         if cache_dir.exists():
-            shutil.rmtree(cache_dir, ignore_errors=True)
+            _clear_logo_cache(cache_dir, logo_path)
         
         return True, f"Fastfetch logo tinted: {logo_path}"
     
@@ -191,6 +462,8 @@ def apply_fastfetch_accent(accent_color: str) -> Tuple[bool, str]:
         return False, f"ImageMagick error: {e.stderr.decode() if e.stderr else str(e)}"
     except Exception as e:
         return False, f"Error: {e}"
+    finally:
+        tmp_logo_path.unlink(missing_ok=True)
 
 
 def restore_fastfetch_backup() -> Tuple[bool, str]:
@@ -210,12 +483,15 @@ def restore_fastfetch_backup() -> Tuple[bool, str]:
     if not backup_path.exists():
         return False, f"No backup file found: {backup_path}"
     
+    tmp_logo_path = _get_temp_sibling(logo_path)
     try:
-        shutil.copy2(backup_path, logo_path)
+        tmp_logo_path.unlink(missing_ok=True)
+        _link_or_copy(backup_path, tmp_logo_path)
+        os.replace(tmp_logo_path, logo_path)
         
         # Clear cache
         if cache_dir.exists():
-            shutil.rmtree(cache_dir, ignore_errors=True)
+            _clear_logo_cache(cache_dir, logo_path)
         
         return True, "Fastfetch logo restored from backup"
     except Exception as e:
@@ -290,10 +566,55 @@ def set_custom_logo(image_path: str) -> Tuple[bool, str]:
         return False, f"Error: {e}"
 
 
+def _get_preview_cache_path(source: Path, accent_color: str) -> Path:
+    """Get the cached preview path for a source image and accent color.
+    
+    The key includes the source mtime and size, so editing the image in
+    place produces a new preview instead of a stale one.
+    """
+    st = source.stat()
+    key = hashlib.blake2b(
+        f"{source}|{st.st_mtime_ns}|{st.st_size}|{accent_color.lower()}".encode(),
+        digest_size=16
+    ).hexdigest()
+    return _get_preview_cache_dir() / f"{key}{source.suffix or '.png'}"
+
+
+def _next_preview_tmp_path(suffix: str) -> Path:
+    """Get the next temp filename from the preview ring.
+    
+    Final previews keep unique per-key names (QML caches images by URL), so
+    only the temporary render target is recycled. The cache dir is per
+    user and the pid keeps processes from sharing slots.
+    """
+    with _PREVIEW_TMP_LOCK:
+        index = next(_PREVIEW_TMP_RING)
+    return _get_preview_cache_dir() / f".preview_{os.getpid()}_{index}.tmp{suffix}"
+
+
+def _evict_cache_dir(cache_dir: Path, max_entries: int) -> None:
+    """Remove the least recently used files beyond max_entries."""
+    try:
+        entries = sorted(
+            os.scandir(cache_dir),
+            key=lambda entry: entry.stat().st_mtime_ns,
+            reverse=True
+        )
+    except OSError:
+        return
+    
+    for entry in entries[max_entries:]:
+        try:
+            os.unlink(entry.path)
+        except OSError:
+            pass
+
+
 def generate_tinted_preview(source_path: str, accent_color: str) -> Optional[str]:
     """Generate a tinted preview of a logo image.
     
-    Creates a temporary tinted version of the image for preview purposes.
+    Previews are cached per source image and accent color, so repeated
+    requests for the same pair return the existing file.
     
     Args:
         source_path: Path to the source image
@@ -302,35 +623,88 @@ def generate_tinted_preview(source_path: str, accent_color: str) -> Optional[str
     Returns:
         Path to the preview image, or None on error.
     """
-    import tempfile
+    if not _HEX_RE.fullmatch(accent_color):
+        logger.error(f"Invalid accent color: {accent_color}")
+        return None
     
     source = Path(source_path)
     if not source.exists():
         return None
     
+    tmp_path = None
     try:
-        # Create temp file with same extension
-        suffix = source.suffix or '.png'
-        fd, preview_path = tempfile.mkstemp(suffix=suffix, prefix='fastfetch_preview_')
-        import os
-        os.close(fd)
+        preview_path = _get_preview_cache_path(source, accent_color)
+        if preview_path.exists():
+            os.utime(preview_path)  # Mark as recently used
+            return str(preview_path)
         
-        # Convert to grayscale
-        subprocess.run([
-            'magick', str(source),
-            '-colorspace', 'gray',
-            preview_path
-        ], check=True, capture_output=True)
+        preview_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
         
-        # Apply tint
-        subprocess.run([
-            'magick', preview_path,
-            '-fill', accent_color,
-            '-tint', '80',
-            preview_path
-        ], check=True, capture_output=True)
+        # Render into a temp file from the ring and rename it into place, so
+        # readers never see a partially written preview
+        tmp_path = _next_preview_tmp_path(preview_path.suffix)
         
-        return preview_path
+        # Convert to grayscale and apply tint
+        _tint_image(source, tmp_path, accent_color)
+        os.replace(tmp_path, preview_path)
+        
+        _evict_cache_dir(preview_path.parent, _PREVIEW_CACHE_MAX_ENTRIES)
+        return str(preview_path)
     except Exception as e:
         logger.error(f"Error generating preview: {e}")
         return None
+    finally:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+
+# =============================================================================
+# CLI Interface
+# =============================================================================
+
+def _print_result(success: bool, message: str) -> None:
+    """Print an apply result as a one-line JSON envelope."""
+    print(json.dumps({
+        'success': success,
+        'message': message,
+        'logo_path': get_current_logo_path(),
+    }, ensure_ascii=False), flush=True)
+
+
+def main() -> int:
+    """CLI entry point for standalone usage.
+    
+    Applies a single accent color, or with --batch one accent per stdin
+    line, so Python starts up only once for many colors.
+    Each result is printed as one JSON line with success, message and
+    logo_path keys.
+    
+    Returns:
+        Process exit code (0 if every accent was applied).
+    """
+    import sys
+    
+    if len(sys.argv) != 2:
+        print("Usage: python3 -m integrations.fastfetch '#569cc1'")
+        print("       python3 -m integrations.fastfetch --batch < accents.txt")
+        return 1
+    
+    if sys.argv[1] != '--batch':
+        success, message = apply_fastfetch_accent(sys.argv[1])
+        _print_result(success, message)
+        return 0 if success else 1
+    
+    exit_code = 0
+    for line in sys.stdin:
+        accent = line.strip()
+        if not accent:
+            continue
+        success, message = apply_fastfetch_accent(accent)
+        _print_result(success, message)
+        if not success:
+            exit_code = 1
+    return exit_code
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -5,24 +5,34 @@ A unified module that combines the functionality of the old
 previous ones and is the only module that the application should use.
 """
 
-import configparser
+import functools
+import heapq
+import itertools
 import logging
+import os
+import re
 import subprocess
 import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
-from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Sequence, Tuple
 
 
-logger = logging.getLogger(__name__)
+# Core color utilities; core.color_utils does not import this module.
+# Hct is None when materialyoucolor is not installed
+from core.color_utils import (
+    HAS_MATERIAL_YOU, Hct,
+    hex_to_hsl, hsl_to_hex, hsl_to_hex_ramp,
+    blend_colors, get_contrast_ratio,
+    create_material_you_scheme, get_material_you_colors_from_scheme,
+    is_material_you_available,
+)
+
 
-# Core color utilities - imported locally to avoid circular imports
-# from core.color_utils import (
-#     hex_to_rgb, hex_to_hsl, hsl_to_hex,
-#     blend_colors, get_contrast_ratio,
-#     create_material_you_scheme, get_material_you_colors_from_scheme,
-#     is_material_you_available,
-# )
+logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
@@ -30,69 +40,346 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
+# Color scheme locations, resolved once
+_USER_SCHEMES_DIR = Path.home() / ".local/share/color-schemes"
+_SYSTEM_SCHEMES_DIR = Path("/usr/share/color-schemes")
+_BACKUP_DIR = _USER_SCHEMES_DIR / "backups"
+
+# Section headers; greedy so "[Colors:Header][Inactive]" stays one section
+_SECTION_RE = re.compile(r'^[ \t]*\[(.*)\][ \t]*\r?$', re.MULTILINE)
+# The whitespace bytes.strip() removes; str.strip() would also take Unicode spaces
+_INI_WS = ' \t\r\x0b\x0c'
+
+
+def _parse_ini_bytes(data: bytes) -> Dict[str, Dict[str, str]]:
+    """Parse KDE-style INI content into {section: {key: value}}.
+
+    Scheme files are plain "[Section]" + "key=value" lines, so this skips
+    configparser entirely: the file is decoded once, sections are located
+    with one regex pass and each block is split into lines. Keys keep
+    their case, comments and lines before the first section are ignored,
+    repeated sections merge.
+    """
+    text = data.decode('utf-8', 'replace')
+    result: Dict[str, Dict[str, str]] = {}
+    headers = list(_SECTION_RE.finditer(text))
+    for i, header in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+        section = result.setdefault(header.group(1), {})
+        for line in text[header.end():end].split('\n'):
+            line = line.strip(_INI_WS)
+            if not line or line[0] in '#;':
+                continue
+            key, sep, value = line.partition('=')
+            if sep:
+                section[key.rstrip(_INI_WS)] = value.lstrip(_INI_WS)
+    return result
+
+
+def _format_ini(data: Dict[str, Dict[str, str]]) -> str:
+    """Format {section: {key: value}} as KDE-style INI content.
+
+    Matches configparser.write(space_around_delimiters=False) output.
+    """
+    parts: List[str] = []
+    for section, keys in data.items():
+        parts.append(f"[{section}]\n")
+        parts.extend(f"{key}={value}\n" for key, value in keys.items())
+        parts.append("\n")
+    return "".join(parts)
+
+
+# Resolved scheme paths by name, and raw/parsed schemes keyed by file stat
+_scheme_path_cache: Dict[str, Path] = {}
+_scheme_parse_cache: Dict[Path, Tuple[Tuple[int, int], Mapping[str, Mapping[str, Tuple[str, float]]]]] = {}
+_scheme_raw_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Dict[str, str]]]] = {}
+_scheme_info_cache: Dict[Path, Tuple[Tuple[int, int], "SchemeInfo"]] = {}
+
+
 def get_scheme_file_path(scheme_name: str) -> Path | None:
     """Get the file path for a color scheme by name."""
-    user_path = Path.home() / ".local/share/color-schemes" / f"{scheme_name}.colors"
-    if user_path.exists():
-        return user_path
+    cached = _scheme_path_cache.get(scheme_name)
+    if cached is not None:
+        return cached
 
-    system_path = Path("/usr/share/color-schemes") / f"{scheme_name}.colors"
-    if system_path.exists():
-        return system_path
+    for base in (_USER_SCHEMES_DIR, _SYSTEM_SCHEMES_DIR):
+        path = base / f"{scheme_name}.colors"
+        try:
+            path.stat()
+        except FileNotFoundError:
+            continue
+        _scheme_path_cache[scheme_name] = path
+        return path
 
     return None
 
 
-def parse_scheme_file(scheme_name: str) -> Dict[str, Dict[str, Tuple[str, float]]]:
+def _invalidate_scheme_cache(scheme_name: str) -> None:
+    """Forget the cached path and parse of a scheme after writing it.
+
+    A new user scheme shadows a system one with the same name, and a rewrite
+    can keep the same size within one mtime tick, so both are dropped. Any
+    write to a Kuntatinte scheme also forgets the last generated save.
+    """
+    global _last_kuntatinte_save
+    scheme_path = _scheme_path_cache.pop(scheme_name, None)
+    if scheme_path is not None:
+        _scheme_parse_cache.pop(scheme_path, None)
+        _scheme_raw_cache.pop(scheme_path, None)
+        _scheme_info_cache.pop(scheme_path, None)
+    if scheme_name in _KUNTATINTE_SCHEME_NAMES:
+        _last_kuntatinte_save = None
+
+
+# Directories already created (or found) by this process
+_ensured_dirs: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    if path in _ensured_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(path)
+
+
+def _write_file_atomic(path: Path, data: bytes, mode: int = 0o644) -> None:
+    """Replace path with data via a hidden sibling file and os.replace."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _backup_scheme(scheme_path: Path, backup_path: Path) -> bool:
+    """Keep the current contents of scheme_path at backup_path.
+
+    Schemes are always replaced with _write_file_atomic rather than
+    rewritten in place, so a hard link preserves the old file without
+    copying it. Tries the link first instead of checking for the scheme.
+
+    Returns:
+        False if there was no scheme to back up
+    """
+    try:
+        os.link(scheme_path, backup_path)
+    except FileNotFoundError:
+        return False
+    except OSError:
+        shutil.copy(scheme_path, backup_path)
+    return True
+
+
+_last_backup_time = -1
+_last_backup_second = ""
+_backup_counter = itertools.count(1)
+
+
+def _backup_timestamp() -> str:
+    """Get a backup name timestamp, unique within this process.
+
+    Saves within the same second get a counter suffix instead of
+    overwriting each other's backups. The timestamp is only formatted
+    again once the clock reaches a new second.
+    """
+    global _last_backup_time, _last_backup_second, _backup_counter
+    now = int(time.time())
+    if now != _last_backup_time:
+        _last_backup_time = now
+        second = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+        # Differs unless local time repeats (e.g. when DST ends)
+        if second != _last_backup_second:
+            _last_backup_second = second
+            _backup_counter = itertools.count(1)
+            return second
+    return f"{_last_backup_second}_{next(_backup_counter)}"
+
+
+def _stat_scheme(scheme_name: str) -> Tuple[Path, Tuple[int, int]] | None:
+    """Locate a scheme and get the (mtime_ns, size) key its caches use."""
     scheme_path = get_scheme_file_path(scheme_name)
     if not scheme_path:
-        return {}
-
-    result: Dict[str, Dict[str, Tuple[str, float]]] = {}
+        return None
 
     try:
-        config = configparser.ConfigParser()
-        config.optionxform = lambda optionstr: optionstr
-        config.read(scheme_path)
+        st = scheme_path.stat()
+    except OSError:
+        # Removed since its path was cached; resolve it again
+        _invalidate_scheme_cache(scheme_name)
+        scheme_path = get_scheme_file_path(scheme_name)
+        if not scheme_path:
+            return None
+        st = scheme_path.stat()
+
+    return scheme_path, (st.st_mtime_ns, st.st_size)
+
+
+def _read_scheme_raw(scheme_path: Path, stat_key: Tuple[int, int]) -> Dict[str, Dict[str, str]]:
+    """Read a scheme file as raw strings, once per stat_key."""
+    cached = _scheme_raw_cache.get(scheme_path)
+    if cached is not None and cached[0] == stat_key:
+        return cached[1]
+    raw = _parse_ini_bytes(scheme_path.read_bytes())
+    _scheme_raw_cache[scheme_path] = (stat_key, raw)
+    return raw
+
+
+def parse_scheme_file(scheme_name: str) -> Mapping[str, Mapping[str, Tuple[str, float]]]:
+    """Parse a scheme into {section: {key: (hex, opacity)}}.
+
+    The result is cached until the file changes and shared between
+    callers, so it is returned read-only.
+    """
+    located = _stat_scheme(scheme_name)
+    if not located:
+        return {}
+    scheme_path, stat_key = located
 
-        for section in config.sections():
-            result[section] = {}
-            for key, value in config.items(section):
-                hex_color, opacity = parse_kde_color(value)
-                result[section][key] = (hex_color, opacity)
+    cached = _scheme_parse_cache.get(scheme_path)
+    if cached is not None and cached[0] == stat_key:
+        return cached[1]
 
-        return result
+    result: Dict[str, Mapping[str, Tuple[str, float]]] = {}
+    # Schemes repeat a few dozen colors across sections; share one interned
+    # hex string and one (hex, opacity) tuple per distinct raw value
+    colors: Dict[str, Tuple[str, float]] = {}
+
+    try:
+        for section, keys in _read_scheme_raw(scheme_path, stat_key).items():
+            parsed = {}
+            for key, value in keys.items():
+                color = colors.get(value)
+                if color is None:
+                    hex_color, opacity = parse_kde_color(value)
+                    color = colors[value] = (sys.intern(hex_color), opacity)
+                parsed[key] = color
+            result[section] = MappingProxyType(parsed)
+
+        view = MappingProxyType(result)
+        _scheme_parse_cache[scheme_path] = (stat_key, view)
+        return view
     except Exception as e:
         logger.error(f"Error parsing scheme file: {e}")
         return {}
 
 
+def read_scheme_values(scheme_name: str) -> Dict[str, Dict[str, str]]:
+    """Read a scheme as raw {section: {key: value}} strings.
+
+    The result is cached until the file changes and must not be modified.
+    """
+    located = _stat_scheme(scheme_name)
+    if not located:
+        return {}
+    try:
+        return _read_scheme_raw(*located)
+    except OSError as e:
+        logger.error(f"Error reading scheme file: {e}")
+        return {}
+
+
+def read_scheme_file(scheme_path: Path) -> Dict[str, Dict[str, str]]:
+    """Read a .colors file by path as raw {section: {key: value}} strings.
+
+    Shares the stat-keyed cache of read_scheme_values; the result must not
+    be modified.
+    """
+    try:
+        st = scheme_path.stat()
+        return _read_scheme_raw(scheme_path, (st.st_mtime_ns, st.st_size))
+    except OSError as e:
+        logger.error(f"Error reading scheme file: {e}")
+        return {}
+
+
+class SchemeInfo(NamedTuple):
+    """Section layout of a scheme file."""
+    structure: Mapping[str, Tuple[str, ...]]
+    color_sections: Tuple[str, ...]
+    inactive_sections: Tuple[str, ...]
+
+
+_EMPTY_SCHEME_INFO = SchemeInfo(MappingProxyType({}), (), ())
+
+
+def scheme_info(scheme_name: str) -> SchemeInfo:
+    """Get a scheme's keys per section, color sections and inactive sections.
+
+    All three are derived in one pass over the sections and cached until
+    the file changes.
+    """
+    located = _stat_scheme(scheme_name)
+    if not located:
+        return _EMPTY_SCHEME_INFO
+    scheme_path, stat_key = located
+
+    cached = _scheme_info_cache.get(scheme_path)
+    if cached is not None and cached[0] == stat_key:
+        return cached[1]
+
+    try:
+        data = _read_scheme_raw(scheme_path, stat_key)
+    except OSError as e:
+        logger.error(f"Error reading scheme file: {e}")
+        return _EMPTY_SCHEME_INFO
+
+    structure: Dict[str, Tuple[str, ...]] = {}
+    color_sections: List[str] = []
+    inactive: List[str] = []
+    for section, keys in data.items():
+        structure[section] = tuple(keys)
+        if section in _ACTIVE_COLOR_SECTIONS:
+            color_sections.append(section)
+        elif section in _INACTIVE_COLOR_SECTIONS:
+            inactive.append(_INACTIVE_COLOR_SECTIONS[section])
+        # Sections outside the standard color sets
+        elif "][Inactive" in section:
+            inactive.append(section.split("][")[0])
+        elif section.startswith("Colors:") and "][" not in section:
+            color_sections.append(section)
+
+    info = SchemeInfo(MappingProxyType(structure), tuple(color_sections), tuple(inactive))
+    _scheme_info_cache[scheme_path] = (stat_key, info)
+    return info
+
+
 def get_scheme_structure(scheme_name: str) -> Dict[str, List[str]]:
-    data = parse_scheme_file(scheme_name)
-    return {section: list(keys.keys()) for section, keys in data.items()}
+    return {section: list(keys) for section, keys in scheme_info(scheme_name).structure.items()}
 
 
 def get_color_sections(scheme_name: str) -> List[str]:
-    data = parse_scheme_file(scheme_name)
-    return [s for s in data.keys() if s.startswith("Colors:") and "][" not in s]
+    return list(scheme_info(scheme_name).color_sections)
 
 
 def get_inactive_sections(scheme_name: str) -> List[str]:
-    data = parse_scheme_file(scheme_name)
-    inactive: List[str] = []
-    for s in data.keys():
-        if "][Inactive" in s:
-            base = s.split("][")[0]
-            inactive.append(base)
-    return inactive
+    return list(scheme_info(scheme_name).inactive_sections)
 
 
-def get_section_colors(scheme_name: str, section: str) -> Dict[str, Tuple[str, float]]:
+def get_section_colors(scheme_name: str, section: str) -> Mapping[str, Tuple[str, float]]:
     data = parse_scheme_file(scheme_name)
     return data.get(section, {})
 
 
 def get_current_scheme_name() -> str:
+    # Read from the cached kdeglobals cascade; kreadconfig6 is only needed
+    # when there is no user kdeglobals yet
+    try:
+        if _get_kdeglobals_path().exists():
+            return _read_kdeglobals_value("General", "ColorScheme") or "Unknown"
+    except Exception as e:
+        logger.warning(f"Error reading kdeglobals, using kreadconfig6: {e}")
+
     try:
         result = subprocess.run(
             ["kreadconfig6", "--group", "General", "--key", "ColorScheme"],
@@ -105,15 +392,42 @@ def get_current_scheme_name() -> str:
         return "Unknown"
 
 
+# "#rrggbb" -> (r, g, b); scheme generation formats the same few dozen colors
+_HEX_CACHE: Dict[str, Tuple[int, int, int]] = {}
+_HEX_CACHE_MAX_SIZE = 4096
+
+
+def _hex_rgb(hex_color: str) -> Tuple[int, int, int]:
+    rgb = _HEX_CACHE.get(hex_color)
+    if rgb is None:
+        raw = bytes.fromhex(hex_color.lstrip("#"))
+        if len(raw) != 3:
+            raise ValueError(f"Invalid hex color: {hex_color}")
+        if len(_HEX_CACHE) >= _HEX_CACHE_MAX_SIZE:
+            _HEX_CACHE.clear()
+        rgb = _HEX_CACHE[hex_color] = (raw[0], raw[1], raw[2])
+    return rgb
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_hex(hex_color: str) -> int:
+    """Parse "#rrggbb" into a 0xRRGGBB int."""
+    return int(hex_color.lstrip('#'), 16)
+
+
 def parse_kde_color(color_str: str) -> tuple[str, float]:
+    return _parse_kde_color(color_str.strip() if color_str else "")
+
+
+# Scheme files and kdeglobals repeat the same few dozen values
+@functools.lru_cache(maxsize=4096)
+def _parse_kde_color(color_str: str) -> tuple[str, float]:
     if not color_str:
         return "#000000", 1.0
 
-    color_str = color_str.strip()
-
     if color_str.startswith("#"):
         if len(color_str) == 9:  # #aarrggbb
-            alpha = int(color_str[1:3], 16)
+            alpha = bytes.fromhex(color_str[1:3])[0]
             hex_color = "#" + color_str[3:9]
             return hex_color, alpha / 255.0
         elif len(color_str) == 7:
@@ -125,7 +439,7 @@ def parse_kde_color(color_str: str) -> tuple[str, float]:
         if len(parts) >= 3:
             try:
                 r, g, b = int(parts[0]), int(parts[1]), int(parts[2])
-                hex_color = f"#{r:02x}{g:02x}{b:02x}"
+                hex_color = "#" + bytes((r, g, b)).hex()
 
                 if len(parts) == 4:
                     alpha = int(parts[3])
@@ -138,17 +452,14 @@ def parse_kde_color(color_str: str) -> tuple[str, float]:
     return "#000000", 1.0
 
 
+@functools.lru_cache(maxsize=1024)
 def format_kde_color(hex_color: str, opacity: float = 1.0, always_rgba: bool = True) -> str:
     if not hex_color or not hex_color.startswith("#"):
         return "0,0,0,255" if always_rgba else "0,0,0"
 
-    hex_str = hex_color.lstrip("#")
-    if len(hex_str) == 6:
-        r = int(hex_str[0:2], 16)
-        g = int(hex_str[2:4], 16)
-        b = int(hex_str[4:6], 16)
-    else:
+    if len(hex_color.lstrip("#")) != 6:
         return "0,0,0,255" if always_rgba else "0,0,0"
+    r, g, b = _hex_rgb(hex_color)
 
     a = round(opacity * 255)
 
@@ -160,15 +471,134 @@ def format_kde_color(hex_color: str, opacity: float = 1.0, always_rgba: bool = T
         return f"{r},{g},{b}"
 
 
+# ---------------------------------------------------------------------------
+# Direct kdeglobals access (instead of one kreadconfig6/kwriteconfig6 per key)
+# ---------------------------------------------------------------------------
+
+_kdeglobals_cache: Tuple[Tuple[Any, ...], Dict[str, Dict[str, str]]] | None = None
+
+
+def _get_kdeglobals_path() -> Path:
+    """Get the user kdeglobals path (the file kwriteconfig6 writes)."""
+    config_home = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+    return Path(config_home) / "kdeglobals"
+
+
+def _get_kdeglobals_cascade() -> List[Path]:
+    """Get kdeglobals files in KConfig cascade order, system files first."""
+    config_dirs = os.environ.get("XDG_CONFIG_DIRS") or "/etc/xdg"
+    system = [Path(d) / "kdeglobals" for d in reversed(config_dirs.split(":")) if d]
+    return system + [_get_kdeglobals_path()]
+
+
+def _read_kdeglobals() -> Dict[str, Dict[str, str]]:
+    """Read the merged kdeglobals cascade as {group: {key: value}}.
+
+    Parsed once and cached until any file in the cascade changes, so a
+    full color set costs a few stat calls instead of one process per key.
+    The inode is part of the key because atomic rewrites (ours and
+    KConfig's) replace the file, often with the same size and mtime tick.
+    """
+    global _kdeglobals_cache
+
+    paths = _get_kdeglobals_cascade()
+    stat_key = []
+    for path in paths:
+        try:
+            st = path.stat()
+            stat_key.append((st.st_ino, st.st_mtime_ns, st.st_size))
+        except OSError:
+            stat_key.append(None)
+    stat_key_tuple = tuple(stat_key)
+
+    if _kdeglobals_cache is not None and _kdeglobals_cache[0] == stat_key_tuple:
+        return _kdeglobals_cache[1]
+
+    merged: Dict[str, Dict[str, str]] = {}
+    for path, st in zip(paths, stat_key):
+        if st is None:
+            continue
+        try:
+            for group, keys in _parse_ini_bytes(path.read_bytes()).items():
+                merged.setdefault(group, {}).update(keys)
+        except OSError as e:
+            logger.warning(f"Could not read {path}: {e}")
+
+    _kdeglobals_cache = (stat_key_tuple, merged)
+    return merged
+
+
+def _read_kdeglobals_value(group: str, key: str) -> str:
+    """Read one raw kdeglobals value ('' if missing), like kreadconfig6."""
+    return _read_kdeglobals().get(group, {}).get(key, "")
+
+
+def _write_kdeglobals(updates: Dict[str, Dict[str, str]]) -> None:
+    """Write several kdeglobals keys in one atomic file rewrite.
+
+    Existing lines are kept verbatim; updated keys are replaced in place and
+    new keys are appended to their group (new groups at the end).
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    global _kdeglobals_cache
+
+    path = _get_kdeglobals_path()
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        lines = []
+
+    pending = {group: dict(keys) for group, keys in updates.items()}
+    out: List[str] = []
+    current: str | None = None
+
+    def flush_group() -> None:
+        """Append keys still pending for the current group."""
+        keys = pending.pop(current, None) if current is not None else None
+        if not keys:
+            return
+        # Insert before the blank lines that separate groups
+        insert_at = len(out)
+        while insert_at > 0 and not out[insert_at - 1].strip():
+            insert_at -= 1
+        out[insert_at:insert_at] = [f"{key}={value}" for key, value in keys.items()]
+
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("[") and stripped.endswith("]"):
+            flush_group()
+            current = stripped[1:-1]
+        elif current in pending:
+            key, sep, _ = line.partition("=")
+            key = key.strip()
+            if sep and key in pending[current]:
+                line = f"{key}={pending[current].pop(key)}"
+        out.append(line)
+    flush_group()
+
+    for group, keys in pending.items():
+        if not keys:
+            continue
+        if out and out[-1].strip():
+            out.append("")
+        out.append(f"[{group}]")
+        out.extend(f"{key}={value}" for key, value in keys.items())
+
+    # Keep the permissions of an existing file; KConfig creates it private
+    try:
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o600
+    _ensure_dir(path.parent)
+    _write_file_atomic(path, ("\n".join(out) + "\n").encode("utf-8"), mode)
+    _kdeglobals_cache = None
+
+
 def read_color(color_set: str, key: str) -> str:
     try:
-        group = f"Colors:{color_set}"
-        result = subprocess.run(
-            ["kreadconfig6", "--file", "kdeglobals", "--group", group, "--key", key],
-            capture_output=True,
-            text=True
-        )
-        color_str = result.stdout.strip()
+        color_str = _read_kdeglobals_value(f"Colors:{color_set}", key)
         hex_color, _ = parse_kde_color(color_str)
         return hex_color
     except Exception as e:
@@ -178,28 +608,26 @@ def read_color(color_set: str, key: str) -> str:
 
 def read_color_with_opacity(color_set: str, key: str) -> tuple[str, float]:
     try:
-        group = f"Colors:{color_set}"
-        result = subprocess.run(
-            ["kreadconfig6", "--file", "kdeglobals", "--group", group, "--key", key],
-            capture_output=True,
-            text=True
-        )
-        color_str = result.stdout.strip()
+        color_str = _read_kdeglobals_value(f"Colors:{color_set}", key)
         return parse_kde_color(color_str)
     except Exception as e:
         logger.error(f"Error reading color: {e}")
         return "#000000", 1.0
 
 
-def write_color(color_set: str, key: str, color: str, opacity: float = 1.0, notify: bool = False) -> bool:
-    try:
-        group = f"Colors:{color_set}"
-        kde_color = format_kde_color(color, opacity)
+def _write_color_cmd(color_set: str, key: str, color: str, opacity: float = 1.0, notify: bool = False) -> List[str]:
+    group = f"Colors:{color_set}"
+    kde_color = format_kde_color(color, opacity)
 
-        cmd = ["kwriteconfig6", "--file", "kdeglobals", "--group", group, "--key", key, kde_color]
-        if notify:
-            cmd.insert(-1, "--notify")
+    cmd = ["kwriteconfig6", "--file", "kdeglobals", "--group", group, "--key", key, kde_color]
+    if notify:
+        cmd.insert(-1, "--notify")
+    return cmd
 
+
+def write_color(color_set: str, key: str, color: str, opacity: float = 1.0, notify: bool = False) -> bool:
+    try:
+        cmd = _write_color_cmd(color_set, key, color, opacity, notify)
         result = subprocess.run(cmd, capture_output=True, text=True)
         return result.returncode == 0
     except Exception as e:
@@ -215,12 +643,14 @@ COLOR_KEYS = [
     "DecorationFocus", "DecorationHover"
 ]
 
+# Section names of the standard color sets; inactive ones map to their base
+_ACTIVE_COLOR_SECTIONS = frozenset(f"Colors:{s}" for s in COLOR_SETS)
+_INACTIVE_COLOR_SECTIONS = {f"Colors:{s}][Inactive": f"Colors:{s}" for s in COLOR_SETS}
+
 
 def get_color_set(color_set: str) -> dict:
-    colors = {}
-    for key in COLOR_KEYS:
-        colors[key] = read_color(color_set, key)
-    return colors
+    group = _read_kdeglobals().get(f"Colors:{color_set}", {})
+    return {key: parse_kde_color(group.get(key, ""))[0] for key in COLOR_KEYS}
 
 
 def get_all_colors() -> dict:
@@ -230,119 +660,111 @@ def get_all_colors() -> dict:
     return all_colors
 
 
+# Keys apply_palette_to_scheme writes for each color set, and per set the
+# index of each key's value in (bg_dark, bg_normal, bg_alt, fg_normal,
+# fg_inactive, fg_active, accent, selection_fg)
+_SET_RECIPE_KEYS = (
+    "BackgroundNormal", "BackgroundAlternate",
+    "ForegroundNormal", "ForegroundInactive", "ForegroundActive",
+    "DecorationFocus", "DecorationHover",
+)
+_SET_RECIPE: Dict[str, Tuple[int, ...]] = {
+    "View": (0, 1, 3, 4, 5, 6, 6),
+    "Window": (1, 2, 3, 4, 5, 6, 6),
+    "Button": (1, 2, 3, 4, 5, 6, 6),
+    "Selection": (6, 6, 7, 4, 5, 6, 6),
+    "Tooltip": (1, 2, 3, 4, 5, 6, 6),
+    "Complementary": (1, 0, 3, 4, 5, 6, 6),
+    "Header": (1, 1, 3, 4, 5, 6, 6),
+}
+
+
 def apply_palette_to_scheme(palette: list, accent: str | None = None) -> bool:
     if len(palette) < 8:
         logger.error("Palette must have at least 8 colors")
         return False
 
-    # Import here to avoid circular imports
-    from core.color_utils import hex_to_hsl
 
-    # Cache HSL conversions to avoid repeated calculations
-    hsl_cache = {color: hex_to_hsl(color) for color in palette}
-    
-    sorted_palette = sorted(palette, key=lambda c: hsl_cache[c]['l'])
-    avg_luminance = sum(hsl_cache[c]['l'] for c in palette) / len(palette)
+    # One HSL pass; the index breaks ties the same way a stable sort would
+    ranked = [(hex_to_hsl(color)['l'], i, color) for i, color in enumerate(palette)]
+    avg_luminance = sum(entry[0] for entry in ranked) / len(ranked)
     is_dark = avg_luminance < 50
 
     if is_dark:
-        bg_dark = sorted_palette[0]
-        bg_normal = sorted_palette[1]
-        bg_alt = sorted_palette[2]
-        fg_inactive = sorted_palette[4]
-        fg_normal = sorted_palette[-1]
-        fg_active = sorted_palette[-2]
+        darkest = [entry[2] for entry in heapq.nsmallest(5, ranked)]
+        lightest = [entry[2] for entry in heapq.nlargest(2, ranked)]
+        bg_dark, bg_normal, bg_alt, _, fg_inactive = darkest
+        fg_normal, fg_active = lightest
     else:
-        bg_dark = sorted_palette[-1]
-        bg_normal = sorted_palette[-2]
-        bg_alt = sorted_palette[-3]
-        fg_inactive = sorted_palette[3]
-        fg_normal = sorted_palette[0]
-        fg_active = sorted_palette[1]
+        darkest = [entry[2] for entry in heapq.nsmallest(4, ranked)]
+        lightest = [entry[2] for entry in heapq.nlargest(3, ranked)]
+        fg_normal, fg_active, _, fg_inactive = darkest
+        bg_dark, bg_normal, bg_alt = lightest
 
     accent_color = accent if accent else palette[0]
+    selection_fg = fg_normal if is_dark else bg_dark
+
+    values = (bg_dark, bg_normal, bg_alt, fg_normal, fg_inactive, fg_active, accent_color, selection_fg)
+    formatted = tuple(format_kde_color(color) for color in values)
 
-    color_mapping = {
-        "View": {
-            "BackgroundNormal": bg_dark,
-            "BackgroundAlternate": bg_normal,
-            "ForegroundNormal": fg_normal,
-            "ForegroundInactive": fg_inactive,
-            "ForegroundActive": fg_active,
-            "DecorationFocus": accent_color,
-            "DecorationHover": accent_color,
-        },
-        "Window": {
-            "BackgroundNormal": bg_normal,
-            "BackgroundAlternate": bg_alt,
-            "ForegroundNormal": fg_normal,
-            "ForegroundInactive": fg_inactive,
-            "ForegroundActive": fg_active,
-            "DecorationFocus": accent_color,
-            "DecorationHover": accent_color,
-        },
-        "Button": {
-            "BackgroundNormal": bg_normal,
-            "BackgroundAlternate": bg_alt,
-            "ForegroundNormal": fg_normal,
-            "ForegroundInactive": fg_inactive,
-            "ForegroundActive": fg_active,
-            "DecorationFocus": accent_color,
-            "DecorationHover": accent_color,
-        },
-        "Selection": {
-            "BackgroundNormal": accent_color,
-            "BackgroundAlternate": accent_color,
-            "ForegroundNormal": fg_normal if is_dark else bg_dark,
-            "ForegroundInactive": fg_inactive,
-            "ForegroundActive": fg_active,
-            "DecorationFocus": accent_color,
-            "DecorationHover": accent_color,
-        },
-        "Tooltip": {
-            "BackgroundNormal": bg_normal,
-            "BackgroundAlternate": bg_alt,
-            "ForegroundNormal": fg_normal,
-            "ForegroundInactive": fg_inactive,
-            "ForegroundActive": fg_active,
-            "DecorationFocus": accent_color,
-            "DecorationHover": accent_color,
-        },
-        "Complementary": {
-            "BackgroundNormal": bg_normal,
-            "BackgroundAlternate": bg_dark,
-            "ForegroundNormal": fg_normal,
-            "ForegroundInactive": fg_inactive,
-            "ForegroundActive": fg_active,
-            "DecorationFocus": accent_color,
-            "DecorationHover": accent_color,
-        },
-        "Header": {
-            "BackgroundNormal": bg_normal,
-            "BackgroundAlternate": bg_normal,
-            "ForegroundNormal": fg_normal,
-            "ForegroundInactive": fg_inactive,
-            "ForegroundActive": fg_active,
-            "DecorationFocus": accent_color,
-            "DecorationHover": accent_color,
-        },
+    updates = {
+        f"Colors:{color_set}": {key: formatted[i] for key, i in zip(_SET_RECIPE_KEYS, recipe)}
+        for color_set, recipe in _SET_RECIPE.items()
     }
+    try:
+        _write_kdeglobals(updates)
+        return True
+    except Exception as e:
+        logger.warning(f"Direct kdeglobals write failed, using kwriteconfig6: {e}")
+
+    cmds = [
+        _write_color_cmd(color_set, key, values[i])
+        for color_set, recipe in _SET_RECIPE.items()
+        for key, i in zip(_SET_RECIPE_KEYS, recipe)
+    ]
+    return _run_kwriteconfig_batch(cmds)
+
+
+def _run_kwriteconfig_batch(cmds: List[List[str]]) -> bool:
+    """Run kwriteconfig6 commands as overlapping child processes.
+
+    Each call is a fork/exec/exit with no shared state, so up to eight
+    are kept in flight and reaped oldest first. KConfig locks kdeglobals
+    around each write.
+    """
+    max_running = 8
+    running: List[subprocess.Popen] = []
+    ok = True
+
+    def reap(proc: subprocess.Popen) -> bool:
+        _, stderr = proc.communicate()
+        if proc.returncode != 0:
+            logger.error(f"Error writing color: {stderr.decode(errors='replace').strip()}")
+            return False
+        return True
 
-    success = True
-    for color_set, colors in color_mapping.items():
-        for key, color in colors.items():
-            if not write_color(color_set, key, color):
-                success = False
+    for cmd in cmds:
+        if len(running) >= max_running:
+            ok = reap(running.pop(0)) and ok
+        try:
+            running.append(subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE))
+        except Exception as e:
+            logger.error(f"Error writing color: {e}")
+            ok = False
 
-    return success
+    for proc in running:
+        ok = reap(proc) and ok
+    return ok
 
 
 def notify_color_change():
+    # The single flush after a direct kdeglobals write; its output is unused
     try:
         subprocess.run(
             ["kwriteconfig6", "--file", "kdeglobals", "--group", "General", 
              "--key", "ColorSchemeHash", "--notify", ""],
-            capture_output=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
         )
         return True
     except Exception as e:
@@ -356,14 +778,7 @@ def read_color_from_scheme(scheme_name: str, color_set: str, key: str) -> str:
         return "#000000"
 
     try:
-        group = f"Colors:{color_set}"
-        result = subprocess.run(
-            ["kreadconfig6", "--file", str(scheme_path), "--group", group, "--key", key],
-            capture_output=True,
-            text=True
-        )
-        color_str = result.stdout.strip()
-        hex_color, _ = parse_kde_color(color_str)
+        hex_color, _ = parse_scheme_file(scheme_name).get(f"Colors:{color_set}", {}).get(key, ("#000000", 1.0))
         return hex_color
     except Exception as e:
         logger.error(f"Error reading color from scheme: {e}")
@@ -371,32 +786,59 @@ def read_color_from_scheme(scheme_name: str, color_set: str, key: str) -> str:
 
 
 def get_color_set_from_scheme(scheme_name: str, color_set: str) -> dict:
-    colors = {}
-    for key in COLOR_KEYS:
-        colors[key] = read_color_from_scheme(scheme_name, color_set, key)
-    return colors
+    section = parse_scheme_file(scheme_name).get(f"Colors:{color_set}", {})
+    return {key: section.get(key, ("#000000", 1.0))[0] for key in COLOR_KEYS}
+
+
+def _list_scheme_stems(directory: Path) -> List[str]:
+    try:
+        with os.scandir(directory) as entries:
+            return [e.name[:-7] for e in entries if e.name.endswith(".colors") and e.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+# Last scheme list, keyed by the mtimes of the scheme directories
+_schemes_list_cache: Tuple[Tuple[int | None, ...], List[str]] | None = None
+
+
+def _dir_mtime(directory: Path) -> int | None:
+    try:
+        return directory.stat().st_mtime_ns
+    except OSError:
+        return None
 
 
 def get_color_schemes_list() -> list:
-    schemes: List[str] = []
+    global _schemes_list_cache
+    directories = [_SYSTEM_SCHEMES_DIR, _USER_SCHEMES_DIR]
+
+    # Adding, removing or renaming a scheme changes its directory's mtime
+    stat_key = tuple(_dir_mtime(d) for d in directories)
+    if _schemes_list_cache is not None and _schemes_list_cache[0] == stat_key:
+        return list(_schemes_list_cache[1])
+
+    # Scan both directories concurrently; directory reads are I/O bound
+    with ThreadPoolExecutor(max_workers=len(directories)) as executor:
+        results = executor.map(_list_scheme_stems, directories)
 
-    system_path = Path("/usr/share/color-schemes")
-    if system_path.exists():
-        schemes.extend([f.stem for f in system_path.glob("*.colors")])
+    schemes = sorted(set().union(*results))
+    _schemes_list_cache = (stat_key, schemes)
+    return list(schemes)
 
-    user_path = Path.home() / ".local/share/color-schemes"
-    if user_path.exists():
-        schemes.extend([f.stem for f in user_path.glob("*.colors")])
 
-    return sorted(set(schemes))
+@functools.lru_cache(maxsize=1)
+def _plasma_apply_colorscheme() -> str:
+    """Resolve plasma-apply-colorscheme once instead of on every apply."""
+    return shutil.which("plasma-apply-colorscheme") or "plasma-apply-colorscheme"
 
 
 def apply_color_scheme(scheme_name: str) -> bool:
     try:
         result = subprocess.run(
-            ["plasma-apply-colorscheme", scheme_name],
-            capture_output=True,
-            text=True
+            [_plasma_apply_colorscheme(), scheme_name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
         )
         return result.returncode == 0
     except Exception as e:
@@ -405,58 +847,47 @@ def apply_color_scheme(scheme_name: str) -> bool:
 
 
 def save_color_scheme(scheme_name: str, _is_dark: bool) -> bool:
-    user_schemes_dir = Path.home() / ".local/share/color-schemes"
-    user_schemes_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(_USER_SCHEMES_DIR)
 
-    scheme_path = user_schemes_dir / f"{scheme_name}.colors"
+    scheme_path = _USER_SCHEMES_DIR / f"{scheme_name}.colors"
 
-    if scheme_path.exists():
-        backup_dir = user_schemes_dir / "backups"
-        backup_dir.mkdir(exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = backup_dir / f"{scheme_name}_{timestamp}.colors"
-        shutil.copy(scheme_path, backup_path)
+    _ensure_dir(_BACKUP_DIR)
+    timestamp = _backup_timestamp()
+    backup_path = _BACKUP_DIR / f"{scheme_name}_{timestamp}.colors"
+    if _backup_scheme(scheme_path, backup_path):
         logger.info(f"Backup created: {backup_path}")
 
     try:
-        config = configparser.ConfigParser()
-        config.optionxform = lambda optionstr: optionstr
+        config: Dict[str, Dict[str, str]] = {}
 
         config['General'] = {
             'ColorScheme': scheme_name,
             'Name': scheme_name
         }
 
+        # One cached kdeglobals read for every color set and the WM group
+        kde = _read_kdeglobals()
+
         for color_set in COLOR_SETS:
             section = f"Colors:{color_set}"
             config[section] = {}
+            group = kde.get(section, {})
             for key in COLOR_KEYS:
-                color = read_color(color_set, key)
-                if color and color != "#000000":
-                    hex_color = color.lstrip("#")
-                    if len(hex_color) == 6:
-                        r = int(hex_color[0:2], 16)
-                        g = int(hex_color[2:4], 16)
-                        b = int(hex_color[4:6], 16)
-                        config[section][key] = f"{r},{g},{b}"
+                color, _ = parse_kde_color(group.get(key, ""))
+                if color and color != "#000000" and len(color.lstrip("#")) == 6:
+                    config[section][key] = format_rgb(color)
 
         wm_section = "WM"
         config[wm_section] = {}
         wm_keys = ["activeBackground", "activeForeground", "inactiveBackground", 
                    "inactiveForeground", "activeBlend", "inactiveBlend"]
+        wm_group = kde.get("WM", {})
         for key in wm_keys:
-            try:
-                result = subprocess.run(
-                    ["kreadconfig6", "--file", "kdeglobals", "--group", "WM", "--key", key],
-                    capture_output=True, text=True
-                )
-                if result.stdout.strip():
-                    config[wm_section][key] = result.stdout.strip()
-            except:
-                pass
+            if wm_group.get(key, "").strip():
+                config[wm_section][key] = wm_group[key].strip()
 
-        with open(scheme_path, 'w') as f:
-            config.write(f, space_around_delimiters=False)
+        _write_file_atomic(scheme_path, _format_ini(config).encode('utf-8'))
+        _invalidate_scheme_cache(scheme_name)
 
         logger.info(f"Color scheme saved: {scheme_path}")
         return True
@@ -466,22 +897,18 @@ def save_color_scheme(scheme_name: str, _is_dark: bool) -> bool:
 
 
 def save_color_scheme_from_data(scheme_name: str, _is_dark: bool, colors_data: dict) -> bool:
-    user_schemes_dir = Path.home() / ".local/share/color-schemes"
-    user_schemes_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(_USER_SCHEMES_DIR)
 
-    scheme_path = user_schemes_dir / f"{scheme_name}.colors"
+    scheme_path = _USER_SCHEMES_DIR / f"{scheme_name}.colors"
 
-    if scheme_path.exists():
-        backup_dir = user_schemes_dir / "backups"
-        backup_dir.mkdir(exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = backup_dir / f"{scheme_name}_{timestamp}.colors"
-        shutil.copy(scheme_path, backup_path)
+    _ensure_dir(_BACKUP_DIR)
+    timestamp = _backup_timestamp()
+    backup_path = _BACKUP_DIR / f"{scheme_name}_{timestamp}.colors"
+    if _backup_scheme(scheme_path, backup_path):
         logger.info(f"Backup created: {backup_path}")
 
     try:
-        config = configparser.ConfigParser()
-        config.optionxform = lambda optionstr: optionstr
+        config: Dict[str, Dict[str, str]] = {}
 
         config['General'] = {
             'ColorScheme': scheme_name,
@@ -506,8 +933,8 @@ def save_color_scheme_from_data(scheme_name: str, _is_dark: bool, colors_data: d
                 else:
                     config[section][key] = str(value)
 
-        with open(scheme_path, 'w') as f:
-            config.write(f, space_around_delimiters=False)
+        _write_file_atomic(scheme_path, _format_ini(config).encode('utf-8'))
+        _invalidate_scheme_cache(scheme_name)
 
         logger.info(f"Color scheme saved: {scheme_path}")
         return True
@@ -522,31 +949,66 @@ def save_color_scheme_from_data(scheme_name: str, _is_dark: bool, colors_data: d
 
 
 # Tone helpers
-TONES = list(range(0, 101))
+TONES = tuple(range(0, 101))
+# Tones KuntatinteSchemeGenerator reads itself (fallback schemes and previews)
+_CONSUMED_TONES = (5, 10, 12, 17, 20, 22, 30, 40, 50, 60, 80, 90, 92, 94, 95, 99, 100)
+
 
+@functools.lru_cache(maxsize=256)
+def _tonal_ramp(h: float, s: float, tones: Tuple[int, ...]) -> Tuple[str, ...]:
+    """Hex colors of one hue/saturation at each tone, computed once per key."""
+    return tuple(hsl_to_hex_ramp(h, s, tones))
 
-def generate_tonal_palette(base_color: str) -> Dict[int, str]:
-    # Import here to avoid circular imports
-    from core.color_utils import hex_to_hsl, hsl_to_hex
+
+def _gen_tonal_from_hsl(h: float, s: float, tones: Sequence[int] = TONES) -> Dict[int, str]:
+    tones = tuple(tones)
+    return dict(zip(tones, _tonal_ramp(h, s, tones)))
+
+
+def _gen_neutral_from_hsl(h: float, s: float, saturation_factor: float, tones: Sequence[int] = TONES) -> Dict[int, str]:
+    return _gen_tonal_from_hsl(h, s * saturation_factor, tones)
+
+
+def generate_tones(base_color: str, needed: Iterable[int]) -> Dict[int, str]:
+    """Generate only the needed tones of a color's tonal palette."""
     hsl = hex_to_hsl(base_color)
-    palette: Dict[int, str] = {}
-    for tone in TONES:
-        new_l = tone
-        palette[tone] = hsl_to_hex(hsl['h'], hsl['s'], new_l)
-    return palette
+    return _gen_tonal_from_hsl(hsl['h'], hsl['s'], needed)
+
+
+def generate_tonal_palette(base_color: str, tones: Sequence[int] = TONES) -> Dict[int, str]:
+    return generate_tones(base_color, tones)
 
 
 def generate_neutral_palette(base_color: str, saturation_factor: float = 0.08) -> Dict[int, str]:
-    # Import here to avoid circular imports
-    from core.color_utils import hex_to_hsl, hsl_to_hex
     hsl = hex_to_hsl(base_color)
-    palette: Dict[int, str] = {}
-    for tone in TONES:
-        new_s = hsl['s'] * saturation_factor
-        palette[tone] = hsl_to_hex(hsl['h'], new_s, tone)
-    return palette
+    return _gen_neutral_from_hsl(hsl['h'], hsl['s'], saturation_factor)
+
+
+@functools.lru_cache(maxsize=128)
+def _tonal_palettes_for(primary: str, tones: Tuple[int, ...] = TONES) -> Mapping[str, Mapping[int, str]]:
+    """Build every tonal palette of a primary color, limited to tones.
+
+    Secondary and tertiary bases are snapped to 8-bit RGB before their
+    palettes are built, as the generated schemes always did. The result is
+    shared by every generator with this primary, so it is returned read-only.
+    """
+    hsl = hex_to_hsl(primary)
+    h, s, l = hsl['h'], hsl['s'], hsl['l']
+    secondary = hsl_to_hex((h + 30) % 360, s * 0.6, l)
+    tertiary = hsl_to_hex((h + 60) % 360, s * 0.8, l)
+    palettes = {
+        'primary': _gen_tonal_from_hsl(h, s, tones),
+        'secondary': generate_tones(secondary, tones),
+        'tertiary': generate_tones(tertiary, tones),
+        'neutral': _gen_neutral_from_hsl(h, s, 0.05, tones),
+        'neutralVariant': _gen_neutral_from_hsl(h, s, 0.12, tones),
+        'error': generate_tones("#ba1a1a", tones),
+    }
+    return MappingProxyType({name: MappingProxyType(tones) for name, tones in palettes.items()})
 
 
+# Pure in its arguments and usually asked for the same few color pairs
+@functools.lru_cache(maxsize=2048)
 def blend2contrast(
     color: str,
     background: str,
@@ -555,20 +1017,16 @@ def blend2contrast(
     step: float = 0.05,
     _lighter: bool = True
 ) -> str:
-    # Import here to avoid circular imports
-    from core.color_utils import get_contrast_ratio, blend_colors
+    ratio, blend = get_contrast_ratio, blend_colors
     current = color
     for _ in range(100):
-        contrast = get_contrast_ratio(current, background)
-        if contrast >= min_contrast:
+        if ratio(current, background) >= min_contrast:
             return current
-        current = blend_colors(current, target_color, step)
+        current = blend(current, target_color, step)
     return current
 
 
 def scale_saturation(hex_color: str, factor: float) -> str:
-    # Import here to avoid circular imports
-    from core.color_utils import hex_to_hsl, hsl_to_hex
     hsl = hex_to_hsl(hex_color)
     new_s = min(100, max(0, hsl['s'] * factor))
     return hsl_to_hex(hsl['h'], new_s, hsl['l'])
@@ -578,29 +1036,147 @@ def lighten_color(hex_color: str, amount: float, target: str) -> str:
     return blend_colors(hex_color, target, amount)
 
 
+@functools.lru_cache(maxsize=1024)
 def hex2alpha(hex_color: str, opacity: int) -> str:
-    # Import here to avoid circular imports
-    from core.color_utils import hex_to_rgb
-    r, g, b = hex_to_rgb(hex_color)
+    r, g, b = _hex_rgb(hex_color)
     a = int(opacity * 255 / 100)
     return f"{r},{g},{b},{a}"
 
 
+@functools.lru_cache(maxsize=1024)
 def format_rgb(hex_color: str) -> str:
-    # Import here to avoid circular imports
-    from core.color_utils import hex_to_rgb
-    r, g, b = hex_to_rgb(hex_color)
+    r, g, b = _hex_rgb(hex_color)
     return f"{r},{g},{b}"
 
 
+@functools.lru_cache(maxsize=1024)
 def format_rgba(hex_color: str, opacity: float = 1.0) -> str:
-    # Import here to avoid circular imports
-    from core.color_utils import hex_to_rgb
-    r, g, b = hex_to_rgb(hex_color)
+    r, g, b = _hex_rgb(hex_color)
     a = int(opacity * 255)
     return f"{r},{g},{b},{a}"
 
 
+# KDE scheme templates; sections are joined with a blank line between them
+EFFECTS_TEMPLATE = (
+    "[ColorEffects:Disabled]\n"
+    "Color={disabled_color}\n"
+    "ColorAmount=0.5\n"
+    "ColorEffect=3\n"
+    "ContrastAmount=0\n"
+    "ContrastEffect=0\n"
+    "IntensityAmount=0\n"
+    "IntensityEffect=0\n"
+    "\n"
+    "[ColorEffects:Inactive]\n"
+    "ChangeSelectionColor=true\n"
+    "Color={inactive_color}\n"
+    "ColorAmount=0.025\n"
+    "ColorEffect=0\n"
+    "ContrastAmount=0.1\n"
+    "ContrastEffect=0\n"
+    "Enable={inactive_enabled}\n"
+    "IntensityAmount=0\n"
+    "IntensityEffect=0\n"
+)
+
+# Body of a [Colors:*] section; the header line is added per section
+SECTION_TEMPLATE = (
+    "BackgroundAlternate={background_alternate}\n"
+    "BackgroundNormal={background}\n"
+    "DecorationFocus={focus}\n"
+    "DecorationHover={hover}\n"
+    "ForegroundActive={foreground_active}\n"
+    "ForegroundInactive={foreground_inactive}\n"
+    "ForegroundLink={link}\n"
+    "ForegroundNegative={negative}\n"
+    "ForegroundNeutral={neutral}\n"
+    "ForegroundNormal={foreground}\n"
+    "ForegroundPositive={positive}\n"
+    "ForegroundVisited={visited}\n"
+)
+
+FOOTER_TEMPLATE = (
+    "[General]\n"
+    "ColorScheme={color_scheme_name}\n"
+    "Name={color_scheme_name}\n"
+    "shadeSortColumn=true\n"
+    "\n"
+    "[KDE]\n"
+    "contrast=4\n"
+    "\n"
+    "[WM]\n"
+    "activeBackground={wm_active_background}\n"
+    "activeBlend={active_blend}\n"
+    "activeForeground={on_surface}\n"
+    "inactiveBackground={wm_inactive_background}\n"
+    "inactiveBlend={inactive_blend}\n"
+    "inactiveForeground={on_surface_variant}\n"
+)
+
+
+# [Colors:*] sections as SECTION_TEMPLATE field -> rendered color name.
+# Most sections share the state colors, focus/hover and inactive text.
+_SECTION_BASE_FIELDS = {
+    'link': 'link', 'negative': 'negative', 'neutral': 'neutral',
+    'positive': 'positive', 'visited': 'visited',
+    'focus': 'primary', 'hover': 'primary', 'foreground_inactive': 'outline',
+}
+_HEADER_FIELDS = dict(
+    _SECTION_BASE_FIELDS, background_alternate='surface_container', background='surface_container',
+    foreground_active='inverse_surface', foreground='on_surface_variant')
+_SCHEME_SECTIONS = (
+    ('Button', dict(_SECTION_BASE_FIELDS, background_alternate='surface_variant',
+                    background='surface_container_high',
+                    foreground_active='on_surface', foreground='on_surface')),
+    ('Complementary', dict(_SECTION_BASE_FIELDS, background_alternate='surface',
+                           background='surface_container',
+                           foreground_active='inverse_surface', foreground='on_surface_variant')),
+    # Active and inactive headers are identical
+    ('Header', _HEADER_FIELDS),
+    ('Header][Inactive', _HEADER_FIELDS),
+    ('Selection', dict(background_alternate='primary', background='primary',
+                       focus='primary', hover='secondary',
+                       foreground_active='on_primary', foreground_inactive='on_primary',
+                       foreground='on_primary',
+                       link='link_on_fixed', negative='negative_on_fixed',
+                       neutral='neutral_on_fixed', positive='positive_on_fixed',
+                       visited='visited_on_fixed')),
+    ('Tooltip', dict(_SECTION_BASE_FIELDS, background_alternate='surface_variant',
+                     background='surface_container',
+                     foreground_active='on_surface', foreground='on_surface')),
+    ('View', dict(_SECTION_BASE_FIELDS, background_alternate='surface_container',
+                  background='view_background', hover='view_hover',
+                  foreground_active='inverse_surface', foreground='on_surface')),
+    ('Window', dict(_SECTION_BASE_FIELDS, background_alternate='surface_variant',
+                    background='surface_container',
+                    foreground_active='link', foreground='on_surface_variant')),
+)
+
+# The whole scheme as one template over the rendered color names, so a
+# scheme is a single format_map call
+SCHEME_TEMPLATE = "".join([
+    EFFECTS_TEMPLATE,
+    *(
+        f"\n[Colors:{name}]\n"
+        + SECTION_TEMPLATE.format_map({field: f"{{{color}}}" for field, color in fields.items()})
+        for name, fields in _SCHEME_SECTIONS
+    ),
+    "\n",
+    FOOTER_TEMPLATE,
+])
+
+
+@functools.lru_cache(maxsize=16)
+def _render_scheme(**c: str) -> str:
+    """Render a KDE color scheme from pre-formatted "r,g,b" strings.
+
+    Pure function of its arguments (every color, the scheme name and the
+    WM values), so regenerating with identical inputs returns the cached
+    string.
+    """
+    return SCHEME_TEMPLATE.format_map(c)
+
+
 class KuntatinteSchemeGenerator:
     def __init__(
         self,
@@ -617,14 +1193,10 @@ class KuntatinteSchemeGenerator:
         self.toolbar_opacity = toolbar_opacity
         self.chroma_multiplier = chroma_multiplier
         self.tone_multiplier = tone_multiplier
+        self._primary_hsl = hex_to_hsl(self.primary)
         self._generate_palettes()
-        self._light_scheme = self._generate_light_scheme()
-        self._dark_scheme = self._generate_dark_scheme()
 
     def _generate_palettes(self):
-        # Import here to avoid circular imports
-        from core.color_utils import is_material_you_available
-        
         if is_material_you_available():
             self._generate_material_you_colors()
         else:
@@ -632,8 +1204,6 @@ class KuntatinteSchemeGenerator:
 
     def _generate_material_you_colors(self):
         """Generate Material You color schemes using HCT system."""
-        # Import here to avoid circular imports
-        from core.color_utils import create_material_you_scheme, get_material_you_colors_from_scheme, hex_to_hsl, hsl_to_hex
         
         # Create schemes
         scheme_light = create_material_you_scheme(self.primary, is_dark=False, variant=self.scheme_variant)
@@ -656,22 +1226,6 @@ class KuntatinteSchemeGenerator:
         # Generate additional colors for compatibility
         self._generate_extra_colors()
         
-        # Generate tonal palettes for compatibility (using fallback method)
-        self.tones_primary = generate_tonal_palette(self.primary)
-        self.tones_neutral = generate_neutral_palette(self.primary, 0.05)
-        self.tones_neutral_variant = generate_neutral_palette(self.primary, 0.12)
-
-        hsl = hex_to_hsl(self.primary)
-        secondary_hue = (hsl['h'] + 30) % 360
-        secondary = hsl_to_hex(secondary_hue, hsl['s'] * 0.6, hsl['l'])
-        self.tones_secondary = generate_tonal_palette(secondary)
-
-        tertiary_hue = (hsl['h'] + 60) % 360
-        tertiary = hsl_to_hex(tertiary_hue, hsl['s'] * 0.8, hsl['l'])
-        self.tones_tertiary = generate_tonal_palette(tertiary)
-
-        self.tones_error = generate_tonal_palette("#ba1a1a")
-        
         # Generate semantic colors (links, etc.)
         self._generate_semantic_colors(self.colors_dark['primary'])
 
@@ -689,7 +1243,7 @@ class KuntatinteSchemeGenerator:
         self.colors: Dict[str, Dict[str, Dict[str, str]]] = {}
 
         for name, base in base_colors.items():
-            palette = generate_tonal_palette(base)
+            palette = generate_tones(base, (30, 40, 80))
             self.colors[name] = {
                 'light': {
                     'primary': palette[40],
@@ -701,28 +1255,28 @@ class KuntatinteSchemeGenerator:
                 }
             }
 
+    # Material You scheme attributes the multipliers apply to
+    _SCHEME_COLOR_PROPS = (
+        'primary', 'onPrimary', 'primaryContainer', 'onPrimaryContainer',
+        'secondary', 'onSecondary', 'secondaryContainer', 'onSecondaryContainer', 
+        'tertiary', 'onTertiary', 'tertiaryContainer', 'onTertiaryContainer',
+        'error', 'onError', 'errorContainer', 'onErrorContainer',
+        'surface', 'onSurface', 'surfaceVariant', 'onSurfaceVariant',
+        'outline', 'outlineVariant', 'shadow', 'scrim',
+        'inverseSurface', 'inverseOnSurface', 'inversePrimary'
+    )
+
     def _apply_multipliers_to_scheme(self, scheme, chroma_multiplier: float, tone_multiplier: float):
         """Apply chroma and tone multipliers to a Material You scheme."""
-        # Import here to avoid circular imports
-        try:
-            from materialyoucolor.hct import Hct
-        except ImportError:
+        # Identity multipliers would round-trip every color through HCT unchanged
+        if chroma_multiplier == 1.0 and tone_multiplier == 1.0:
+            return scheme
+        if not HAS_MATERIAL_YOU:
             # If multipliers can't be applied, return original scheme
             return scheme
         
-        # Get all color properties from the scheme
-        color_props = [
-            'primary', 'onPrimary', 'primaryContainer', 'onPrimaryContainer',
-            'secondary', 'onSecondary', 'secondaryContainer', 'onSecondaryContainer', 
-            'tertiary', 'onTertiary', 'tertiaryContainer', 'onTertiaryContainer',
-            'error', 'onError', 'errorContainer', 'onErrorContainer',
-            'surface', 'onSurface', 'surfaceVariant', 'onSurfaceVariant',
-            'outline', 'outlineVariant', 'shadow', 'scrim',
-            'inverseSurface', 'inverseOnSurface', 'inversePrimary'
-        ]
-        
         # Modify colors in place
-        for prop in color_props:
+        for prop in self._SCHEME_COLOR_PROPS:
             if hasattr(scheme, prop):
                 original_argb = getattr(scheme, prop)
                 # Convert ARGB to HCT
@@ -738,21 +1292,15 @@ class KuntatinteSchemeGenerator:
 
     def _apply_multipliers_to_colors(self, colors: Dict[str, str], chroma_multiplier: float, tone_multiplier: float) -> Dict[str, str]:
         """Apply chroma and tone multipliers to color dictionary."""
-        # Import here to avoid circular imports
-        try:
-            from materialyoucolor.hct import Hct
-            from core.color_utils import hex_to_rgb
-        except ImportError:
+        if chroma_multiplier == 1.0 and tone_multiplier == 1.0:
+            return colors
+        if not HAS_MATERIAL_YOU:
             return colors
         
         modified_colors = {}
         for name, hex_color in colors.items():
-            # Convert hex to RGB to ARGB
-            rgb = hex_to_rgb(hex_color)
-            argb = (255 << 24) | (rgb[0] << 16) | (rgb[1] << 8) | rgb[2]
-            
-            # Convert to HCT
-            hct = Hct.from_int(argb)
+            # Convert hex to ARGB and then to HCT
+            hct = Hct.from_int(0xFF000000 | _parse_hex(hex_color))
             
             # Apply multipliers
             hct.chroma *= chroma_multiplier
@@ -760,20 +1308,47 @@ class KuntatinteSchemeGenerator:
             
             # Convert back to hex
             modified_argb = hct.to_int()
-            r = (modified_argb >> 16) & 0xFF
-            g = (modified_argb >> 8) & 0xFF
-            b = modified_argb & 0xFF
-            modified_colors[name] = f"#{r:02x}{g:02x}{b:02x}"
+            modified_colors[name] = "#" + (modified_argb & 0xFFFFFF).to_bytes(3, "big").hex()
         
         return modified_colors
 
+    # Tonal palettes come from the shared per-primary cache, so generators
+    # for the same primary (other variants or opacities) reuse them. Only
+    # the tones read here are built; get_tonal_palettes has all 101
+
+    @functools.cached_property
+    def _consumed_palettes(self) -> Mapping[str, Mapping[int, str]]:
+        return _tonal_palettes_for(self.primary, _CONSUMED_TONES)
+
+    @functools.cached_property
+    def tones_primary(self) -> Mapping[int, str]:
+        return self._consumed_palettes['primary']
+
+    @functools.cached_property
+    def tones_neutral(self) -> Mapping[int, str]:
+        return self._consumed_palettes['neutral']
+
+    @functools.cached_property
+    def tones_neutral_variant(self) -> Mapping[int, str]:
+        return self._consumed_palettes['neutralVariant']
+
+    @functools.cached_property
+    def tones_secondary(self) -> Mapping[int, str]:
+        return self._consumed_palettes['secondary']
+
+    @functools.cached_property
+    def tones_tertiary(self) -> Mapping[int, str]:
+        return self._consumed_palettes['tertiary']
+
+    @functools.cached_property
+    def tones_error(self) -> Mapping[int, str]:
+        return self._consumed_palettes['error']
+
     def _generate_palettes_fallback(self):
         """Generate color palettes using HSL fallback when Material You is not available."""
-        # Import here to avoid circular imports
-        from core.color_utils import hex_to_hsl, hsl_to_hex
         
         # Generate basic colors using HSL
-        hsl = hex_to_hsl(self.primary)
+        hsl = self._primary_hsl
         
         # Light theme colors
         self.colors_light = {
@@ -837,45 +1412,16 @@ class KuntatinteSchemeGenerator:
             'surfaceContainerLowest': '#0b0906',
         }
         
-        # Generate tonal palettes
-        self.tones_primary = generate_tonal_palette(self.primary)
-        self.tones_neutral = generate_neutral_palette(self.primary, 0.05)
-        self.tones_neutral_variant = generate_neutral_palette(self.primary, 0.12)
-        
-        secondary_hue = (hsl['h'] + 30) % 360
-        secondary = hsl_to_hex(secondary_hue, hsl['s'] * 0.6, hsl['l'])
-        self.tones_secondary = generate_tonal_palette(secondary)
-        
-        tertiary_hue = (hsl['h'] + 60) % 360
-        tertiary = hsl_to_hex(tertiary_hue, hsl['s'] * 0.8, hsl['l'])
-        self.tones_tertiary = generate_tonal_palette(tertiary)
-        
-        self.tones_error = generate_tonal_palette("#ba1a1a")
-        
         # Generate semantic colors
         self._generate_semantic_colors(self.primary)
 
     def _generate_semantic_colors(self, primary_color_for_harmonize: str) -> None:
         """Generate semantic colors (link, visited, negative, neutral, positive) using the exact same approach as kde-material-you-colors."""
-        # Import here to avoid circular imports
-        from core.color_utils import create_material_you_scheme, get_material_you_colors_from_scheme
         from materialyoucolor.blend import Blend
-        from materialyoucolor.utils.color_utils import argb_from_rgb
-        
-        def hex_to_argb(hex_color: str) -> int:
-            """Convert hex color to ARGB int."""
-            hex_color = hex_color.lstrip('#')
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            return argb_from_rgb(r, g, b)
         
         def argb_to_hex(argb: int) -> str:
             """Convert ARGB int to hex color."""
-            r = (argb >> 16) & 0xFF
-            g = (argb >> 8) & 0xFF
-            b = argb & 0xFF
-            return f"#{r:02x}{g:02x}{b:02x}"
+            return "#" + (argb & 0xFFFFFF).to_bytes(3, "big").hex()
         
         # Use the exact same base colors as kde-material-you-colors
         base_text_states = [
@@ -890,6 +1436,7 @@ class KuntatinteSchemeGenerator:
 
         # Get the primary color from the main Material You scheme for harmonization
         # This should be the primary from the dark scheme as used in kde-material-you-colors
+        primary_argb = 0xFF000000 | _parse_hex(primary_color_for_harmonize)
         
         for color in base_text_states:
             name = color["name"]
@@ -897,8 +1444,8 @@ class KuntatinteSchemeGenerator:
             
             # Harmonize with primary color if blend is True (as in kde-material-you-colors)
             if color["blend"]:
-                base_argb = hex_to_argb(base_hex)
-                harmonized_argb = Blend.harmonize(base_argb, hex_to_argb(primary_color_for_harmonize))
+                base_argb = 0xFF000000 | _parse_hex(base_hex)
+                harmonized_argb = Blend.harmonize(base_argb, primary_argb)
                 harmonized_hex = argb_to_hex(harmonized_argb)
             else:
                 harmonized_hex = base_hex
@@ -969,22 +1516,6 @@ class KuntatinteSchemeGenerator:
             # Secondary container for WM section
             secondary_container = colors['secondaryContainer']
             
-            # For extras (link, negative, etc.)
-            if hasattr(self, 'colors') and 'link' in self.colors:
-                extras_mode = 'dark' if is_dark else 'light'
-                link_primary = self.colors['link'][extras_mode]['primary']
-                negative_primary = self.colors['negative'][extras_mode]['primary']
-                neutral_primary = self.colors['neutral'][extras_mode]['primary']
-                positive_primary = self.colors['positive'][extras_mode]['primary']
-                visited_primary = self.colors['visited'][extras_mode]['primary']
-            else:
-                # Fallback colors
-                link_primary = '#2980b9' if not is_dark else '#5dade2'
-                negative_primary = '#da4453' if not is_dark else '#ec7063'
-                neutral_primary = '#f67400' if not is_dark else '#f8c471'
-                positive_primary = '#27ae60' if not is_dark else '#82e0aa'
-                visited_primary = '#9b59b6' if not is_dark else '#bb8fce'
-            
             if is_dark:
                 extras_mode = 'dark'
                 color_scheme_name = 'KuntatinteDark'
@@ -1058,203 +1589,109 @@ class KuntatinteSchemeGenerator:
 
         extras = self.colors
 
-        scheme = f"""[ColorEffects:Disabled]
-Color={format_rgb(surface_container)}
-ColorAmount=0.5
-ColorEffect=3
-ContrastAmount=0
-ContrastEffect=0
-IntensityAmount=0
-IntensityEffect=0
-
-[ColorEffects:Inactive]
-ChangeSelectionColor=true
-Color={format_rgb(surface_container_lowest)}
-ColorAmount=0.025
-ColorEffect=0
-ContrastAmount=0.1
-ContrastEffect=0
-Enable={inactive_enabled}
-IntensityAmount=0
-IntensityEffect=0
-
-[Colors:Button]
-BackgroundAlternate={format_rgb(surface_variant)}
-BackgroundNormal={format_rgb(surface_container_high)}
-DecorationFocus={format_rgb(primary)}
-DecorationHover={format_rgb(primary)}
-ForegroundActive={format_rgb(on_surface)}
-ForegroundInactive={format_rgb(outline)}
-ForegroundLink={format_rgb(extras['link'][extras_mode]['primary'])}
-ForegroundNegative={format_rgb(extras['negative'][extras_mode]['primary'])}
-ForegroundNeutral={format_rgb(extras['neutral'][extras_mode]['primary'])}
-ForegroundNormal={format_rgb(on_surface)}
-ForegroundPositive={format_rgb(extras['positive'][extras_mode]['primary'])}
-ForegroundVisited={format_rgb(extras['visited'][extras_mode]['primary'])}
-
-[Colors:Complementary]
-BackgroundAlternate={format_rgb(surface)}
-BackgroundNormal={format_rgb(surface_container)}
-DecorationFocus={format_rgb(primary)}
-DecorationHover={format_rgb(primary)}
-ForegroundActive={format_rgb(inverse_surface)}
-ForegroundInactive={format_rgb(outline)}
-ForegroundLink={format_rgb(extras['link'][extras_mode]['primary'])}
-ForegroundNegative={format_rgb(extras['negative'][extras_mode]['primary'])}
-ForegroundNeutral={format_rgb(extras['neutral'][extras_mode]['primary'])}
-ForegroundNormal={format_rgb(on_surface_variant)}
-ForegroundPositive={format_rgb(extras['positive'][extras_mode]['primary'])}
-ForegroundVisited={format_rgb(extras['visited'][extras_mode]['primary'])}
-
-[Colors:Header]
-BackgroundAlternate={format_rgb(surface_container)}
-BackgroundNormal={format_rgb(surface_container)}
-DecorationFocus={format_rgb(primary)}
-DecorationHover={format_rgb(primary)}
-ForegroundActive={format_rgb(inverse_surface)}
-ForegroundInactive={format_rgb(outline)}
-ForegroundLink={format_rgb(extras['link'][extras_mode]['primary'])}
-ForegroundNegative={format_rgb(extras['negative'][extras_mode]['primary'])}
-ForegroundNeutral={format_rgb(extras['neutral'][extras_mode]['primary'])}
-ForegroundNormal={format_rgb(on_surface_variant)}
-ForegroundPositive={format_rgb(extras['positive'][extras_mode]['primary'])}
-ForegroundVisited={format_rgb(extras['visited'][extras_mode]['primary'])}
-
-[Colors:Header][Inactive]
-BackgroundAlternate={format_rgb(surface_container)}
-BackgroundNormal={format_rgb(surface_container)}
-DecorationFocus={format_rgb(primary)}
-DecorationHover={format_rgb(primary)}
-ForegroundActive={format_rgb(inverse_surface)}
-ForegroundInactive={format_rgb(outline)}
-ForegroundLink={format_rgb(extras['link'][extras_mode]['primary'])}
-ForegroundNegative={format_rgb(extras['negative'][extras_mode]['primary'])}
-ForegroundNeutral={format_rgb(extras['neutral'][extras_mode]['primary'])}
-ForegroundNormal={format_rgb(on_surface_variant)}
-ForegroundPositive={format_rgb(extras['positive'][extras_mode]['primary'])}
-ForegroundVisited={format_rgb(extras['visited'][extras_mode]['primary'])}
-
-[Colors:Selection]
-BackgroundAlternate={format_rgb(primary)}
-BackgroundNormal={format_rgb(primary)}
-DecorationFocus={format_rgb(primary)}
-DecorationHover={format_rgb(secondary)}
-ForegroundActive={format_rgb(on_primary)}
-ForegroundInactive={format_rgb(on_primary)}
-ForegroundLink={format_rgb(extras['link'][extras_mode]['onPrimaryFixedVariant'])}
-ForegroundNegative={format_rgb(extras['negative'][extras_mode]['onPrimaryFixedVariant'])}
-ForegroundNeutral={format_rgb(extras['neutral'][extras_mode]['onPrimaryFixedVariant'])}
-ForegroundNormal={format_rgb(on_primary)}
-ForegroundPositive={format_rgb(extras['positive'][extras_mode]['onPrimaryFixedVariant'])}
-ForegroundVisited={format_rgb(extras['visited'][extras_mode]['onPrimaryFixedVariant'])}
-
-[Colors:Tooltip]
-BackgroundAlternate={format_rgb(surface_variant)}
-BackgroundNormal={format_rgb(surface_container)}
-DecorationFocus={format_rgb(primary)}
-DecorationHover={format_rgb(primary)}
-ForegroundActive={format_rgb(on_surface)}
-ForegroundInactive={format_rgb(outline)}
-ForegroundLink={format_rgb(extras['link'][extras_mode]['primary'])}
-ForegroundNegative={format_rgb(extras['negative'][extras_mode]['primary'])}
-ForegroundNeutral={format_rgb(extras['neutral'][extras_mode]['primary'])}
-ForegroundNormal={format_rgb(on_surface)}
-ForegroundPositive={format_rgb(extras['positive'][extras_mode]['primary'])}
-ForegroundVisited={format_rgb(extras['visited'][extras_mode]['primary'])}
-
-[Colors:View]
-BackgroundAlternate={format_rgb(surface_container)}
-BackgroundNormal={format_rgb(surface_dim if is_dark else surface_bright)}
-DecorationFocus={format_rgb(primary)}
-DecorationHover={format_rgb(inverse_primary if is_dark else secondary_fixed)}
-ForegroundActive={format_rgb(inverse_surface)}
-ForegroundInactive={format_rgb(outline)}
-ForegroundLink={format_rgb(extras['link'][extras_mode]['primary'])}
-ForegroundNegative={format_rgb(extras['negative'][extras_mode]['primary'])}
-ForegroundNeutral={format_rgb(extras['neutral'][extras_mode]['primary'])}
-ForegroundNormal={format_rgb(on_surface)}
-ForegroundPositive={format_rgb(extras['positive'][extras_mode]['primary'])}
-ForegroundVisited={format_rgb(extras['visited'][extras_mode]['primary'])}
-
-[Colors:Window]
-BackgroundAlternate={format_rgb(surface_variant)}
-BackgroundNormal={format_rgb(surface_container)}
-DecorationFocus={format_rgb(primary)}
-DecorationHover={format_rgb(primary)}
-ForegroundActive={format_rgb(extras['link'][extras_mode]['primary'])}
-ForegroundInactive={format_rgb(outline)}
-ForegroundLink={format_rgb(extras['link'][extras_mode]['primary'])}
-ForegroundNegative={format_rgb(extras['negative'][extras_mode]['primary'])}
-ForegroundNeutral={format_rgb(extras['neutral'][extras_mode]['primary'])}
-ForegroundNormal={format_rgb(on_surface_variant)}
-ForegroundPositive={format_rgb(extras['positive'][extras_mode]['primary'])}
-ForegroundVisited={format_rgb(extras['visited'][extras_mode]['primary'])}
-
-[General]
-ColorScheme={color_scheme_name}
-Name={color_scheme_name}
-shadeSortColumn=true
-
-[KDE]
-contrast=4
-
-[WM]
-activeBackground={hex2alpha(surface_container_highest, self.toolbar_opacity)}
-activeBlend={active_blend}
-activeForeground={format_rgb(on_surface)}
-inactiveBackground={hex2alpha(secondary_container, self.toolbar_opacity)}
-inactiveBlend={inactive_blend}
-inactiveForeground={format_rgb(on_surface_variant)}
-"""
-        return scheme
-
-    def _generate_light_scheme(self) -> str:
-        """Generate light KDE color scheme."""
+        # Template field -> "r,g,b"; most colors appear in several sections
+        # but are converted only once here
+        ns = {field: format_rgb(color) for field, color in (
+            ('disabled_color', surface_container),
+            ('inactive_color', surface_container_lowest),
+            ('surface', surface),
+            ('surface_container', surface_container),
+            ('surface_container_high', surface_container_high),
+            ('surface_variant', surface_variant),
+            ('view_background', surface_dim if is_dark else surface_bright),
+            ('primary', primary),
+            ('secondary', secondary),
+            ('view_hover', inverse_primary if is_dark else secondary_fixed),
+            ('on_primary', on_primary),
+            ('on_surface', on_surface),
+            ('on_surface_variant', on_surface_variant),
+            ('inverse_surface', inverse_surface),
+            ('outline', outline),
+        )}
+
+        # "link", "link_on_fixed", ... for each extra color in this mode
+        for name in ('link', 'negative', 'neutral', 'positive', 'visited'):
+            mode_colors = extras[name][extras_mode]
+            ns[name] = format_rgb(mode_colors['primary'])
+            ns[f'{name}_on_fixed'] = format_rgb(mode_colors['onPrimaryFixedVariant'])
+
+        ns['inactive_enabled'] = inactive_enabled
+        ns['color_scheme_name'] = color_scheme_name
+        ns['wm_active_background'] = hex2alpha(surface_container_highest, self.toolbar_opacity)
+        ns['wm_inactive_background'] = hex2alpha(secondary_container, self.toolbar_opacity)
+        ns['active_blend'] = active_blend
+        ns['inactive_blend'] = inactive_blend
+
+        return _render_scheme(**ns)
+
+    @functools.cached_property
+    def light_scheme(self) -> str:
+        """Light KDE color scheme, generated on first access."""
         return self._generate_scheme(is_dark=False)
 
-    def _generate_dark_scheme(self) -> str:
-        """Generate dark KDE color scheme."""
+    @functools.cached_property
+    def dark_scheme(self) -> str:
+        """Dark KDE color scheme, generated on first access."""
         return self._generate_scheme(is_dark=True)
 
+    @functools.cached_property
+    def light_scheme_colors(self) -> Mapping[str, str]:
+        """Section colors parsed back out of the light scheme, for previews."""
+        return MappingProxyType(parse_scheme_colors(self.light_scheme))
+
+    @functools.cached_property
+    def dark_scheme_colors(self) -> Mapping[str, str]:
+        """Section colors parsed back out of the dark scheme, for previews."""
+        return MappingProxyType(parse_scheme_colors(self.dark_scheme))
+
+    @functools.cached_property
+    def light_scheme_bytes(self) -> bytes:
+        """Light scheme encoded for writing, so repeated saves skip the encode."""
+        return self.light_scheme.encode('utf-8')
+
+    @functools.cached_property
+    def dark_scheme_bytes(self) -> bytes:
+        """Dark scheme encoded for writing, so repeated saves skip the encode."""
+        return self.dark_scheme.encode('utf-8')
+
     def get_light_scheme(self) -> str:
-        return self._light_scheme
+        return self.light_scheme
 
     def get_dark_scheme(self) -> str:
-        return self._dark_scheme
-
-    def get_tonal_palettes(self) -> Dict[str, Dict[int, str]]:
-        return {
-            'primary': self.tones_primary,
-            'secondary': self.tones_secondary,
-            'tertiary': self.tones_tertiary,
-            'neutral': self.tones_neutral,
-            'neutralVariant': self.tones_neutral_variant,
-            'error': self.tones_error,
-        }
+        return self.dark_scheme
+
+    def get_tonal_palettes(self) -> Mapping[str, Mapping[int, str]]:
+        return self.tonal_palettes
+
+    @functools.cached_property
+    def tonal_palettes(self) -> Mapping[str, Mapping[int, str]]:
+        """All tonal palettes by name, built on first access."""
+        return _tonal_palettes_for(self.primary)
+
+    def get_preview_colors(self, is_dark: bool = True) -> Mapping[str, str]:
+        return self.preview_dark if is_dark else self.preview_light
+
+    # Preview swatch -> (tonal palette attribute, dark tone, light tone)
+    _PREVIEW_TONES = (
+        ('surface', 'tones_neutral', 10, 99),
+        ('onSurface', 'tones_neutral', 90, 10),
+        ('primary', 'tones_primary', 80, 40),
+        ('onPrimary', 'tones_primary', 20, 100),
+        ('secondary', 'tones_secondary', 80, 40),
+        ('tertiary', 'tones_tertiary', 80, 40),
+        ('error', 'tones_error', 80, 40),
+        ('outline', 'tones_neutral_variant', 60, 50),
+    )
 
-    def get_preview_colors(self, is_dark: bool = True) -> Dict[str, str]:
-        if is_dark:
-            return {
-                'surface': self.tones_neutral[10],
-                'onSurface': self.tones_neutral[90],
-                'primary': self.tones_primary[80],
-                'onPrimary': self.tones_primary[20],
-                'secondary': self.tones_secondary[80],
-                'tertiary': self.tones_tertiary[80],
-                'error': self.tones_error[80],
-                'outline': self.tones_neutral_variant[60],
-            }
-        else:
-            return {
-                'surface': self.tones_neutral[99],
-                'onSurface': self.tones_neutral[10],
-                'primary': self.tones_primary[40],
-                'onPrimary': self.tones_primary[100],
-                'secondary': self.tones_secondary[40],
-                'tertiary': self.tones_tertiary[40],
-                'error': self.tones_error[40],
-                'outline': self.tones_neutral_variant[50],
-            }
+    @functools.cached_property
+    def preview_dark(self) -> Mapping[str, str]:
+        """Dark preview swatches, built on first access."""
+        return MappingProxyType({key: getattr(self, attr)[dark] for key, attr, dark, _ in self._PREVIEW_TONES})
+
+    @functools.cached_property
+    def preview_light(self) -> Mapping[str, str]:
+        """Light preview swatches, built on first access."""
+        return MappingProxyType({key: getattr(self, attr)[light] for key, attr, _, light in self._PREVIEW_TONES})
 
 
 def generate_kuntatinte_schemes(
@@ -1265,66 +1702,154 @@ def generate_kuntatinte_schemes(
     chroma_multiplier: float = 1.0,
     tone_multiplier: float = 0.8
 ) -> Tuple[str, str]:
-    generator = KuntatinteSchemeGenerator(palette, primary_index, scheme_variant, toolbar_opacity, chroma_multiplier, tone_multiplier)
+    primary = palette[primary_index] if palette else "#3daee9"
+    generator = _get_scheme_generator(primary, scheme_variant, toolbar_opacity, chroma_multiplier, tone_multiplier)
     return generator.get_light_scheme(), generator.get_dark_scheme()
 
 
-def save_kuntatinte_scheme(scheme_content: str, scheme_name: str) -> Tuple[bool, str]:
-    user_schemes_dir = Path.home() / ".local/share/color-schemes"
-    user_schemes_dir.mkdir(parents=True, exist_ok=True)
+@functools.lru_cache(maxsize=32)
+def _get_scheme_generator(
+    primary: str,
+    scheme_variant: int,
+    toolbar_opacity: int,
+    chroma_multiplier: float,
+    tone_multiplier: float
+) -> KuntatinteSchemeGenerator:
+    # Output depends only on the primary color and settings, not the rest of the palette
+    return KuntatinteSchemeGenerator([primary], 0, scheme_variant, toolbar_opacity, chroma_multiplier, tone_multiplier)
+
+
+def save_kuntatinte_scheme(scheme_content: str | bytes, scheme_name: str) -> Tuple[bool, str]:
+    return _save_kuntatinte_schemes([(scheme_content, scheme_name)])[0]
 
-    scheme_path = user_schemes_dir / f"{scheme_name}.colors"
 
-    if scheme_path.exists():
-        backup_dir = user_schemes_dir / "backups"
-        backup_dir.mkdir(exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = backup_dir / f"{scheme_name}_{timestamp}.colors"
+def _save_kuntatinte_schemes(schemes: List[Tuple[str | bytes, str]]) -> List[Tuple[bool, str]]:
+    """Back up and write several (content, name) schemes in one pass.
+
+    The target directories are prepared once, all backups share one
+    timestamp and the files are written concurrently.
+    """
+    _ensure_dir(_USER_SCHEMES_DIR)
+    _ensure_dir(_BACKUP_DIR)
+    timestamp = _backup_timestamp()
+
+    def save_one(scheme: Tuple[str | bytes, str]) -> Tuple[bool, str]:
+        scheme_content, scheme_name = scheme
+        scheme_path = _USER_SCHEMES_DIR / f"{scheme_name}.colors"
+        backup_path = _BACKUP_DIR / f"{scheme_name}_{timestamp}.colors"
         try:
-            shutil.copy(scheme_path, backup_path)
+            _backup_scheme(scheme_path, backup_path)
         except Exception as e:
             logger.warning(f"Could not create backup: {e}")
 
-    try:
-        with open(scheme_path, 'w', encoding='utf-8') as f:
-            f.write(scheme_content)
-        return True, f"Scheme saved: {scheme_path}"
-    except Exception as e:
-        return False, f"Error saving scheme: {e}"
+        try:
+            if isinstance(scheme_content, str):
+                scheme_content = scheme_content.encode('utf-8')
+            _write_file_atomic(scheme_path, scheme_content)
+            _invalidate_scheme_cache(scheme_name)
+            return True, f"Scheme saved: {scheme_path}"
+        except Exception as e:
+            return False, f"Error saving scheme: {e}"
+
+    if len(schemes) == 1:
+        return [save_one(schemes[0])]
+
+    # Each scheme is an independent file; overlap their writes
+    with ThreadPoolExecutor(max_workers=len(schemes)) as executor:
+        return list(executor.map(save_one, schemes))
 
 
 def apply_kuntatinte_scheme(scheme_name: str) -> Tuple[bool, str]:
     try:
         result = subprocess.run(
-            ["plasma-apply-colorscheme", scheme_name],
-            capture_output=True,
-            text=True
+            [_plasma_apply_colorscheme(), scheme_name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
         )
         if result.returncode == 0:
             return True, f"Applied: {scheme_name}"
         else:
-            return False, f"Error: {result.stderr}"
+            return False, f"Error: {result.stderr.decode('utf-8', errors='replace')}"
     except Exception as e:
         return False, f"Error applying scheme: {e}"
 
 
+def apply_kuntatinte_scheme_fast(scheme_name: str) -> Tuple[bool, str]:
+    """Apply a scheme by merging it into kdeglobals and signalling over D-Bus.
+
+    Skips launching plasma-apply-colorscheme (a full Qt helper) by copying
+    the scheme's color groups into kdeglobals directly and emitting the
+    KGlobalSettings palette-change signal. Falls back to
+    apply_kuntatinte_scheme if the scheme cannot be read or D-Bus is
+    unreachable.
+    """
+    dbus_send = shutil.which("dbus-send")
+    values = read_scheme_values(scheme_name)
+    if not dbus_send or not values:
+        return apply_kuntatinte_scheme(scheme_name)
+
+    updates = {
+        section: keys for section, keys in values.items()
+        if section.startswith(("Colors:", "ColorEffects:")) or section == "WM"
+    }
+    updates["General"] = {"ColorScheme": scheme_name}
+    try:
+        _write_kdeglobals(updates)
+        # ChangeType 0 = PaletteChanged
+        result = subprocess.run(
+            [dbus_send, "--session", "--type=signal", "/KGlobalSettings",
+             "org.kde.KGlobalSettings.notifyChange", "int32:0", "int32:0"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    except Exception as e:
+        logger.warning(f"Direct scheme apply failed, using plasma-apply-colorscheme: {e}")
+        return apply_kuntatinte_scheme(scheme_name)
+    if result.returncode != 0:
+        return apply_kuntatinte_scheme(scheme_name)
+    return True, f"Applied: {scheme_name}"
+
+
+_KUNTATINTE_SCHEME_NAMES = ("KuntatinteLight", "KuntatinteDark")
+
+# (generator inputs, stat of the written files) of the last successful save
+_last_kuntatinte_save: Tuple[Any, Any] | None = None
+
+
+def _kuntatinte_schemes_stat() -> Tuple[Tuple[int, int], ...] | None:
+    try:
+        stats = [(_USER_SCHEMES_DIR / f"{name}.colors").stat() for name in _KUNTATINTE_SCHEME_NAMES]
+    except OSError:
+        return None
+    return tuple((st.st_mtime_ns, st.st_size) for st in stats)
+
+
 def generate_and_save_kuntatinte_schemes(
     palette: List[str],
     primary_index: int = 0,
     toolbar_opacity: int = 100,
     scheme_variant: int = 5
 ) -> Tuple[bool, str]:
+    global _last_kuntatinte_save
     if not palette:
         return False, "No palette provided"
 
-    light_scheme, dark_scheme = generate_kuntatinte_schemes(
-        palette, primary_index, toolbar_opacity, scheme_variant
-    )
+    # Skip regenerating and rewriting when the inputs match the last save
+    # and nothing has touched the files since
+    key = (palette[primary_index], toolbar_opacity, scheme_variant)
+    if _last_kuntatinte_save is not None and _last_kuntatinte_save[0] == key:
+        stat = _kuntatinte_schemes_stat()
+        if stat is not None and stat == _last_kuntatinte_save[1]:
+            return True, "Kuntatinte Light and Dark schemes generated successfully"
 
-    success_light, msg_light = save_kuntatinte_scheme(light_scheme, "KuntatinteLight")
-    success_dark, msg_dark = save_kuntatinte_scheme(dark_scheme, "KuntatinteDark")
+    generator = _get_scheme_generator(palette[primary_index], scheme_variant, toolbar_opacity, 1.0, 0.8)
+
+    (success_light, msg_light), (success_dark, msg_dark) = _save_kuntatinte_schemes(
+        list(zip((generator.light_scheme_bytes, generator.dark_scheme_bytes), _KUNTATINTE_SCHEME_NAMES))
+    )
 
     if success_light and success_dark:
+        _last_kuntatinte_save = (key, _kuntatinte_schemes_stat())
         return True, "Kuntatinte Light and Dark schemes generated successfully"
     else:
         errors = []
@@ -1355,7 +1880,7 @@ def parse_scheme_colors(scheme_content: str) -> Dict[str, str]:
                 # Convert to hex format for QML
                 try:
                     r, g, b = map(int, rgb.split(','))
-                    hex_color = f"#{r:02x}{g:02x}{b:02x}"
+                    hex_color = "#" + bytes((r, g, b)).hex()
                     
                     # Map KDE color keys to preview-friendly names
                     if current_section == 'Colors:Window':
@@ -1406,33 +1931,28 @@ def get_preview_data(
     primary_index: int = 0,
     scheme_variant: int = 5
 ) -> Dict[str, Any]:
-    generator = KuntatinteSchemeGenerator(palette, primary_index, scheme_variant)
-    
-    # Generate actual KDE schemes to get real colors
-    light_scheme = generator.get_light_scheme()
-    dark_scheme = generator.get_dark_scheme()
-    
-    # Parse the schemes to extract real KDE section colors
-    light_colors = parse_scheme_colors(light_scheme)
-    dark_colors = parse_scheme_colors(dark_scheme)
+    primary = palette[primary_index] if palette else "#3daee9"
+    generator = _get_scheme_generator(primary, scheme_variant, 100, 1.0, 0.8)
     
+    # Real KDE section colors, parsed once per generator from its schemes
     return {
-        'light': light_colors,
-        'dark': dark_colors,
+        'light': generator.light_scheme_colors,
+        'dark': generator.dark_scheme_colors,
         'palettes': generator.get_tonal_palettes(),
     }
 
 
 __all__ = [
     # kde-like helpers
-    'get_scheme_file_path', 'parse_scheme_file', 'get_scheme_structure',
-    'get_color_sections', 'get_inactive_sections', 'get_section_colors',
+    'get_scheme_file_path', 'parse_scheme_file', 'read_scheme_values', 'read_scheme_file', 'get_scheme_structure',
+    'get_color_sections', 'get_inactive_sections', 'get_section_colors', 'scheme_info', 'SchemeInfo',
     'get_current_scheme_name', 'parse_kde_color', 'format_kde_color',
     'read_color', 'read_color_with_opacity', 'write_color', 'COLOR_SETS', 'COLOR_KEYS',
     'get_color_set', 'get_all_colors', 'apply_palette_to_scheme', 'notify_color_change',
     'read_color_from_scheme', 'get_color_set_from_scheme', 'get_color_schemes_list',
     'apply_color_scheme', 'save_color_scheme', 'save_color_scheme_from_data',
     # v2 generator
-    'generate_kuntatinte_schemes', 'save_kuntatinte_scheme', 'apply_kuntatinte_scheme',
+    'generate_kuntatinte_schemes', 'save_kuntatinte_scheme',
+    'apply_kuntatinte_scheme', 'apply_kuntatinte_scheme_fast',
     'generate_and_save_kuntatinte_schemes', 'get_preview_data', 'parse_scheme_colors', 'KuntatinteSchemeGenerator'
 ]